@@ -7,6 +7,7 @@ from src.scraper import UniversityScraper
 from src.database import DatabaseManager
 from src.notifier import Notifier
 from src.agent import UniversityAgent
+from src.retention import RetentionManager
 import logging
 
 def setup_logging():
@@ -37,7 +38,10 @@ def main():
         notifier = Notifier(Config)
         
         # Create and run agent
-        agent = UniversityAgent(scraper, db_manager, notifier)
+        retention_manager = RetentionManager(db_manager, Config)
+        agent = UniversityAgent(scraper, db_manager, notifier, retention_manager,
+                               resume_max_age_hours=Config.CYCLE_RESUME_MAX_AGE_HOURS,
+                               heartbeat_timeout_minutes=Config.CYCLE_HEARTBEAT_TIMEOUT_MINUTES)
         agent.load_universities(universities)
         
         # Choose mode
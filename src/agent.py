@@ -4,45 +4,64 @@ import logging
 from typing import List
 from datetime import datetime
 
+from src.database import process_owner
+
 logger = logging.getLogger(__name__)
 
 class UniversityAgent:
-    def __init__(self, scraper, db_manager, notifier):
+    def __init__(self, scraper, db_manager, notifier, retention_manager=None, resume_max_age_hours: float = 12,
+                 heartbeat_timeout_minutes: float = 30):
         self.scraper = scraper
         self.db_manager = db_manager
         self.notifier = notifier
+        self.retention_manager = retention_manager
+        self.resume_max_age_hours = resume_max_age_hours
+        self.heartbeat_timeout_minutes = heartbeat_timeout_minutes
+        self.owner = process_owner()
         self.universities = []
         
     def load_universities(self, universities_config):
         """Load university configurations"""
         self.universities = universities_config
     
-    def run_scraping_cycle(self):
-        """Run one complete scraping cycle"""
-        logger.info(f"Starting scraping cycle at {datetime.now()}")
+    def run_scraping_cycle(self, resume: bool = True):
+        """Run one complete scraping cycle
         
-        all_new_articles = []
-        all_new_deadlines = []
-        all_new_vacancies = []
+        Progress is checkpointed per university, so with `resume` a cycle
+        interrupted by a crash or restart continues where it stopped. Does
+        nothing while another process is running a cycle.
+        """
+        cycle_id, resumed = self.db_manager.start_cycle(resume, self.resume_max_age_hours, self.owner,
+                                                        self.heartbeat_timeout_minutes)
+        if cycle_id is None:
+            logger.warning("Another process is running a scraping cycle; skipping this one")
+            return 0
+        completed = self.db_manager.get_completed_universities(cycle_id)
+        if resumed:
+            logger.info(f"Resuming scraping cycle {cycle_id} at {datetime.now()} "
+                        f"({len(completed)} universities already done)")
+        else:
+            logger.info(f"Starting scraping cycle {cycle_id} at {datetime.now()}")
         
         for uni_config in self.universities:
+            if uni_config.name in completed:
+                logger.info(f"Skipping {uni_config.name} (already scraped this cycle)")
+                continue
+            if not self.db_manager.heartbeat(cycle_id, self.owner):
+                logger.warning(f"Cycle {cycle_id} was taken over by another process; stopping")
+                return 0
+            
             try:
                 logger.info(f"Scraping {uni_config.name}...")
                 
-                # Scrape news
                 articles = self.scraper.scrape_news(uni_config)
-                new_articles = self.db_manager.save_news_articles(articles)
-                all_new_articles.extend(new_articles)
-                
-                # Scrape application deadlines
                 deadlines = self.scraper.scrape_applications(uni_config)
-                new_deadlines = self.db_manager.save_deadlines(deadlines)
-                all_new_deadlines.extend(new_deadlines)
-                
-                # Scrape vacancies
                 vacancies = self.scraper.scrape_vacancies(uni_config)
-                new_vacancies = self.db_manager.save_vacancies(vacancies)
-                all_new_vacancies.extend(new_vacancies)
+                
+                # Saves, pending notifications and the checkpoint commit together
+                new_articles, new_deadlines, new_vacancies = self.db_manager.save_university_results(
+                    cycle_id, uni_config.name, articles, deadlines, vacancies
+                )
                 
                 logger.info(f"  Found {len(articles)} articles ({len(new_articles)} new)")
                 logger.info(f"  Found {len(deadlines)} deadlines ({len(new_deadlines)} new)")
@@ -55,7 +74,18 @@ class UniversityAgent:
                 logger.error(f"Error scraping {uni_config.name}: {e}")
                 continue
         
-        # Send notifications
+        new_items = self.send_pending_notifications()
+        self.db_manager.finish_cycle(cycle_id)
+        
+        logger.info(f"Scraping cycle {cycle_id} completed at {datetime.now()}")
+        return new_items
+    
+    def send_pending_notifications(self):
+        """Notify about every persisted, unsent item, including ones from interrupted cycles"""
+        pending = self.db_manager.claim_pending_notifications(self.owner, self.heartbeat_timeout_minutes)
+        all_new_articles = pending['news']
+        all_new_deadlines = pending['deadlines']
+        
         if all_new_articles or all_new_deadlines:
             self.notifier.send_console_notification(all_new_articles, all_new_deadlines)
             
@@ -69,9 +99,16 @@ class UniversityAgent:
                         recipients=["your-email@example.com"]
                     )
         
-        logger.info(f"Scraping cycle completed at {datetime.now()}")
+        self.db_manager.clear_pending_notifications(pending['ids'])
         return len(all_new_articles) + len(all_new_deadlines)
     
+    def run_maintenance(self):
+        """Run one time-bounded retention/vacuum pass between scraping cycles"""
+        try:
+            self.retention_manager.run_maintenance(time_budget=self.retention_manager.time_budget)
+        except Exception as e:
+            logger.error(f"Maintenance failed: {e}")
+    
     def run_continuously(self, interval_hours: int = 6):
         """Run the agent continuously on a schedule"""
         logger.info(f"Starting agent with {interval_hours}-hour intervals")
@@ -81,6 +118,8 @@ class UniversityAgent:
         
         # Schedule regular runs
         schedule.every(interval_hours).hours.do(self.run_scraping_cycle)
+        if self.retention_manager:
+            schedule.every(self.retention_manager.interval_minutes).minutes.do(self.run_maintenance)
         
         try:
             while True:
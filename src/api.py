@@ -0,0 +1,144 @@
+import json
+import hashlib
+import threading
+import time
+import logging
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Optional, Tuple
+
+from flask import Flask, Response, jsonify, request
+
+from src.database import MODELS
+
+logger = logging.getLogger(__name__)
+
+# Internal columns not exposed over the API
+HIDDEN_COLUMNS = {'article_hash', 'deadline_hash', 'vacancy_hash'}
+
+
+class ResponseCache:
+    """Thread-safe in-process LRU cache with a TTL per entry"""
+
+    def __init__(self, max_size: int = 512, ttl: float = 60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[Tuple[bytes, str]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value: Tuple[bytes, str]):
+        with self.lock:
+            self.entries[key] = (time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self, *args):
+        """Drop every entry; accepts and ignores commit listener arguments"""
+        with self.lock:
+            self.entries.clear()
+
+
+def _serialize(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def create_app(db_manager, config) -> Flask:
+    """Create the read-only API over `db_manager`"""
+    app = Flask(__name__)
+    cache = ResponseCache(config.API_CACHE_SIZE, config.API_CACHE_TTL)
+    # New rows from a scraping cycle in this process invalidate every cached page
+    db_manager.on_commit(cache.clear)
+    app.config['RESPONSE_CACHE'] = cache
+
+    def render(key, build) -> Response:
+        cached = cache.get(key)
+        if cached is None:
+            body = json.dumps(build(), default=_serialize).encode('utf-8')
+            cached = (body, hashlib.sha1(body).hexdigest())
+            cache.set(key, cached)
+
+        body, etag = cached
+        if etag in request.if_none_match:
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.max_age = int(config.API_CACHE_TTL)
+        return response
+
+    @app.route('/api/<resource>')
+    def list_resource(resource):
+        model = MODELS.get(resource)
+        if model is None:
+            return jsonify({'error': f"Unknown resource: {resource}"}), 404
+
+        try:
+            page = max(int(request.args.get('page', 1)), 1)
+            per_page = min(max(int(request.args.get('per_page', 20)), 1), config.API_MAX_PER_PAGE)
+        except ValueError:
+            return jsonify({'error': "page and per_page must be integers"}), 400
+        university = request.args.get('university') or None
+
+        def build():
+            result = db_manager.get_page(model, page, per_page, university)
+            result['items'] = [
+                {k: v for k, v in item.items() if k not in HIDDEN_COLUMNS}
+                for item in result['items']
+            ]
+            return result
+
+        return render((resource, page, per_page, university, db_manager.data_version), build)
+
+    @app.route('/api/deadlines/upcoming')
+    def upcoming_deadlines():
+        try:
+            days = min(max(int(request.args.get('days', 14)), 0), 366)
+        except ValueError:
+            return jsonify({'error': "days must be an integer"}), 400
+        university = request.args.get('university') or None
+
+        def build():
+            deadlines = db_manager.get_upcoming_deadlines(days, university, config.API_MAX_PER_PAGE)
+            return {
+                'days': days,
+                'items': [
+                    {
+                        'id': d.id,
+                        'university': d.university,
+                        'programme': d.programme,
+                        'deadline_date': d.deadline_date,
+                        'info': d.info,
+                    }
+                    for d in deadlines
+                ],
+            }
+
+        # Keyed by day too, since "upcoming" moves at midnight
+        return render(('upcoming', days, university, date.today(), db_manager.data_version), build)
+
+    @app.route('/api/health')
+    def health():
+        return jsonify({
+            'status': 'ok',
+            'data_version': db_manager.data_version,
+            'cache_entries': len(cache.entries),
+            'cache_hits': cache.hits,
+            'cache_misses': cache.misses,
+        })
+
+    return app
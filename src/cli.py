@@ -1,12 +1,18 @@
 import argparse
 import sys
+import threading
 from tabulate import tabulate
 import json
+from datetime import date
 from src.config import load_universities_config, Config
 from src.scraper import UniversityScraper
 from src.database import DatabaseManager
 from src.notifier import Notifier
 from src.agent import UniversityAgent
+from src.retention import RetentionManager
+from src.discovery import UniversityDiscovery
+from src.stats import StatsEngine, last_days
+from src.api import create_app
 
 def setup_cli():
     """Set up command line interface"""
@@ -18,6 +24,12 @@ def setup_cli():
         help="Run the agent once"
     )
     
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="With --run, start a new cycle instead of resuming an interrupted one"
+    )
+    
     parser.add_argument(
         "--daemon",
         action="store_true",
@@ -32,16 +44,39 @@ def setup_cli():
         help="Show recent news (optional: number of articles)"
     )
     
+    parser.add_argument(
+        "--show-vacancies",
+        type=int,
+        nargs="?",
+        const=10,
+        help="Show recent vacancies (optional: number of vacancies)"
+    )
+    
     parser.add_argument(
         "--university",
         type=str,
         help="Filter by university name"
     )
     
+    parser.add_argument(
+        "--mark-seen",
+        choices=["news", "deadlines", "vacancies", "all"],
+        help="Mark items as seen (filtered by --university, or per reader with --subscriber)"
+    )
+    
+    parser.add_argument(
+        "--subscriber",
+        type=str,
+        help="Track read state for this reader instead of the shared is_new flag"
+    )
+    
     parser.add_argument(
         "--show-deadlines",
-        action="store_true",
-        help="Show application deadlines"
+        type=int,
+        nargs="?",
+        const=14,
+        metavar="DAYS",
+        help="Show application deadlines closing in the next DAYS days (default: 14)"
     )
     
     parser.add_argument(
@@ -50,7 +85,50 @@ def setup_cli():
         help="Update the list of universities from Wikipedia"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Serve the read-only web API (combine with --daemon to scrape in the background)"
+    )
+    
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=Config.API_PORT,
+        help="Port for --serve"
+    )
+    
+    parser.add_argument(
+        "--maintenance",
+        action="store_true",
+        help="Archive expired rows, compress cold bodies and vacuum the database"
+    )
+    
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Show statistics over the scraped history"
+    )
+    
+    parser.add_argument(
+        "--export",
+        type=str,
+        metavar="DIR",
+        help="Export the scraped history tables to DIR"
+    )
+    
+    parser.add_argument(
+        "--export-format",
+        choices=["parquet", "csv"],
+        default="parquet",
+        help="File format for --export (default: parquet)"
+    )
+    
+    args = parser.parse_args()
+    if args.mark_seen and args.subscriber and args.university:
+        # Read markers are a single cursor per table, not per university
+        parser.error("--university cannot be combined with --subscriber for --mark-seen")
+    return args
 
 def show_recent_news(db_manager, limit=10, university=None):
     """Display recent news articles"""
@@ -103,6 +181,64 @@ def show_recent_vacancies(db_manager, limit=10, university=None):
     if len(vacancies) == limit:
         print(f"Showing {limit} most recent vacancies. Use --show-vacancies N for more.")
 
+def show_upcoming_deadlines(db_manager, days=14, university=None):
+    """Display application deadlines closing within the next `days` days"""
+    deadlines = db_manager.get_upcoming_deadlines(days, university)
+    
+    if not deadlines:
+        print(f"No application deadlines in the next {days} days.")
+        return
+    
+    table_data = []
+    for deadline in deadlines:
+        programme = deadline.programme or deadline.info
+        table_data.append([
+            deadline.deadline_date.isoformat(),
+            (deadline.deadline_date - date.today()).days,
+            deadline.university[:30],
+            programme[:50] + "..." if len(programme) > 50 else programme
+        ])
+    
+    headers = ["Closes", "Days Left", "University", "Programme"]
+    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+def mark_seen(db_manager, name, university=None, subscriber=None):
+    """Mark items as seen, globally or for one subscriber"""
+    names = ["news", "deadlines", "vacancies"] if name == "all" else [name]
+    
+    for table_name in names:
+        if subscriber:
+            unread = db_manager.count_unread(subscriber, table_name)
+            cursor = db_manager.advance_read_marker(subscriber, table_name)
+            print(f"{subscriber}: marked {unread} {table_name} items as read (cursor at {cursor}).")
+        else:
+            count = db_manager.mark_seen(table_name, university=university)
+            print(f"Marked {count} {table_name} items as seen.")
+
+def show_stats(db_manager, university=None):
+    """Display per-university and per-period statistics"""
+    report = StatsEngine(db_manager).summary(university)
+    
+    titles = {
+        'news': "📰 NEWS BY UNIVERSITY",
+        'deadlines': "⏰ DEADLINES BY UNIVERSITY",
+        'vacancies': "🏢 VACANCIES BY UNIVERSITY",
+        'monthly': "📅 ITEMS SCRAPED PER MONTH",
+        'daily': "📅 ITEMS SCRAPED PER DAY (LAST 14 DAYS)",
+        'deadline_months': "⏰ DEADLINES PER CLOSING MONTH",
+    }
+    
+    for key, title in titles.items():
+        frame = report[key]
+        if key == 'daily':
+            frame = last_days(frame, 14)
+        
+        print("\n" + title)
+        if frame.empty:
+            print("No data.")
+            continue
+        print(tabulate(frame, headers="keys", tablefmt="grid"))
+
 def main_cli():
     """CLI entry point"""
     args = setup_cli()
@@ -112,14 +248,25 @@ def main_cli():
     scraper = UniversityScraper(Config)
     db_manager = DatabaseManager(Config.DATABASE_URL)
     notifier = Notifier(Config)
-    agent = UniversityAgent(scraper, db_manager, notifier)
+    retention_manager = RetentionManager(db_manager, Config)
+    agent = UniversityAgent(scraper, db_manager, notifier, retention_manager,
+                           resume_max_age_hours=Config.CYCLE_RESUME_MAX_AGE_HOURS,
+                           heartbeat_timeout_minutes=Config.CYCLE_HEARTBEAT_TIMEOUT_MINUTES)
     agent.load_universities(universities)
     
     if args.run:
         print("Running single scraping cycle...")
-        new_items = agent.run_scraping_cycle()
+        new_items = agent.run_scraping_cycle(resume=not args.fresh)
         print(f"Found {new_items} new items.")
     
+    elif args.serve:
+        if args.daemon:
+            # Same process, so committed rows invalidate the API cache immediately
+            threading.Thread(target=agent.run_continuously, daemon=True).start()
+        print(f"Serving API on http://{Config.API_HOST}:{args.port}/api/")
+        app = create_app(db_manager, Config)
+        app.run(host=Config.API_HOST, port=args.port, threaded=True)
+    
     elif args.daemon:
         print("Starting agent as daemon...")
         agent.run_continuously()
@@ -132,32 +279,47 @@ def main_cli():
     
     elif args.update_universities:
         print("Updating universities list from Wikipedia...")
-        scraper = UniversityScraper(Config)
-        universities = scraper.get_south_african_universities()
-        # Save to json
-        import json
-        with open('data/universities.json', 'w') as f:
-            json.dump({'universities': universities}, f, indent=4)
-        print(f"Updated {len(universities)} universities.")
-    
-    elif args.show_deadlines:
-        # Similar function for deadlines
-        pass
+        seeds = scraper.get_south_african_universities()
+        discovery = UniversityDiscovery(Config)
+        universities = discovery.discover(seeds)
+        added, updated = discovery.merge_into_file(universities, 'data/universities.json')
+        print(f"Discovered {len(universities)} universities ({added} added, {updated} updated).")
+    
+    elif args.maintenance:
+        print("Running database maintenance...")
+        stats = retention_manager.run_maintenance(full_vacuum=True)
+        print(f"Archived {stats['archived']} rows, compressed {stats['compressed']} bodies, "
+              f"freed {stats['vacuumed_pages']} pages.")
+    
+    elif args.mark_seen:
+        mark_seen(db_manager, args.mark_seen, args.university, args.subscriber)
+    
+    elif args.show_deadlines is not None:
+        show_upcoming_deadlines(db_manager, args.show_deadlines, args.university)
     
     elif args.stats:
-        # Show statistics
-        pass
+        show_stats(db_manager, args.university)
+    
+    elif args.export:
+        paths = StatsEngine(db_manager).export(args.export, args.export_format, args.university)
+        for path in paths:
+            print(f"Exported {path}")
     
     else:
         print("University Agent - South African Universities Monitor")
         print("\nCommands:")
-        print("  --run           : Run scraping once")
+        print("  --run           : Run scraping once (resumes an interrupted cycle; --fresh to restart)")
         print("  --daemon        : Run continuously")
+        print("  --serve         : Serve the read-only web API (--port N)")
         print("  --show-news N   : Show N recent articles")
         print("  --show-vacancies N : Show N recent vacancies with application links")
+        print("  --show-deadlines D : Show deadlines closing in the next D days")
         print("  --update-universities : Update universities list from Wikipedia")
+        print("  --mark-seen T   : Mark news/deadlines/vacancies/all as seen (--subscriber NAME)")
         print("  --university X  : Filter by university")
         print("  --stats         : Show statistics")
+        print("  --maintenance   : Archive, compress and vacuum the database")
+        print("  --export DIR    : Export history tables (--export-format parquet|csv)")
 
 if __name__ == "__main__":
     main_cli()
\ No newline at end of file
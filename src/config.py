@@ -10,8 +10,8 @@ load_dotenv()
 class UniversityConfig:
     name: str
     base_url: str
-    news_url: str
-    applications_url: str
+    news_url: Optional[str]  # None when discovery found no news page
+    applications_url: Optional[str]
     selectors: Dict  # CSS selectors for scraping
     vacancies_url: Optional[str] = None
     
@@ -28,6 +28,56 @@ class Config:
     REQUEST_TIMEOUT = 10
     USER_AGENT = "UniversityAgent/1.0 (+https://github.com/yourusername/uni-agent)"
     
+    # Unfinished cycles younger than this are resumed after a restart
+    CYCLE_RESUME_MAX_AGE_HOURS = 12
+    # A cycle whose owner hasn't checked in for this long may be taken over
+    CYCLE_HEARTBEAT_TIMEOUT_MINUTES = 30
+    
+    # Selenium browser profile
+    SELENIUM_LIGHTWEIGHT = True  # Block heavy resources and trackers, cap memory
+    SELENIUM_PAGE_LOAD_STRATEGY = "eager"  # Return at DOMContentLoaded, not after every image
+    SELENIUM_PAGE_LOAD_TIMEOUT = 30
+    SELENIUM_SETTLE_SECONDS = 5  # Extra wait for JavaScript-rendered content
+    SELENIUM_MAX_MEMORY_MB = 512  # Per browser process tree; needs psutil
+    SELENIUM_JS_HEAP_MB = 256
+    SELENIUM_BLOCKED_URLS = [
+        # Images, media and fonts
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.mp4", "*.webm", "*.mp3", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+        # Third-party trackers and ads
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*googlesyndication.com*", "*facebook.net*", "*connect.facebook.com*",
+        "*hotjar.com*", "*clarity.ms*", "*linkedin.com/px*", "*snap.licdn.com*",
+        "*twitter.com/i/adsct*", "*analytics.tiktok.com*", "*youtube.com/embed*",
+    ]
+    
+    # University discovery (--update-universities)
+    DISCOVERY_MAX_WORKERS = 16
+    DISCOVERY_MAX_PER_HOST = 2  # Concurrent requests to any one university site
+    DISCOVERY_TIMEOUT = 5
+    DISCOVERY_CACHE_PATH = "data/discovery_cache.json"
+    DISCOVERY_CACHE_TTL_HOURS = 24 * 7
+    
+    # Web API (--serve)
+    API_HOST = "127.0.0.1"
+    API_PORT = 5000
+    API_CACHE_TTL = 60  # seconds; also bounds staleness when another process scrapes
+    API_CACHE_SIZE = 512
+    API_MAX_PER_PAGE = 100
+    
+    # Retention and maintenance
+    ARCHIVE_DATABASE_URL = "sqlite:///data/university_archive.db"
+    RETENTION_POLICIES = {
+        'news': {'max_age_days': 365, 'max_rows': 20000, 'compress_after_days': 30},
+        'deadlines': {'max_age_days': 730, 'max_rows': 10000, 'compress_after_days': 90},
+        'vacancies': {'max_age_days': 365, 'max_rows': 10000, 'compress_after_days': 30},
+    }
+    RETENTION_INTERVAL_MINUTES = 30
+    RETENTION_TIME_BUDGET = 2.0  # seconds per scheduled run
+    RETENTION_BATCH_SIZE = 200
+    RETENTION_MIN_COMPRESS_LENGTH = 256  # bytes; shorter bodies don't shrink
+    RETENTION_VACUUM_PAGES = 64
+    
     # Universities to monitor (we'll populate this)
     UNIVERSITIES: List[UniversityConfig] = []
 
@@ -1,13 +1,43 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime
+from sqlalchemy import create_engine, event, inspect, select, update, delete, bindparam, func, Column, Integer, String, Text, Date, DateTime, UniqueConstraint, TypeDecorator
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.schema import CreateTable, CreateIndex
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 import hashlib
+import json
+import os
+import socket
+import zlib
+import logging
+from src.parser import extract_deadline
+
+logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+class CompressedText(TypeDecorator):
+    """Text column whose cold values may be stored as zlib-compressed BLOBs
+    
+    New rows are written as plain text; RetentionManager compresses old bodies
+    in place. Reads transparently return text either way.
+    """
+    impl = Text
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        return value
+    
+    def process_result_value(self, value, dialect):
+        if isinstance(value, bytes):
+            return zlib.decompress(value).decode('utf-8')
+        return value
+
 class NewsArticle(Base):
     __tablename__ = 'news_articles'
+    # Never reuse ids of archived rows; read cursors depend on ids only growing
+    __table_args__ = {'sqlite_autoincrement': True}
     
     id = Column(Integer, primary_key=True)
     article_hash = Column(String(64), unique=True, index=True)
@@ -15,7 +45,7 @@ class NewsArticle(Base):
     title = Column(String(500))
     url = Column(String(1000))
     date = Column(String(100))
-    content = Column(Text)
+    content = Column(CompressedText)
     scraped_at = Column(DateTime)
     is_new = Column(Integer, default=1)  # 1 = new, 0 = seen
     
@@ -27,16 +57,20 @@ class NewsArticle(Base):
 
 class ApplicationDeadline(Base):
     __tablename__ = 'application_deadlines'
+    __table_args__ = {'sqlite_autoincrement': True}
     
     id = Column(Integer, primary_key=True)
     deadline_hash = Column(String(64), unique=True, index=True)
     university = Column(String(100))
-    info = Column(Text)
+    info = Column(CompressedText)  # Raw row text the fields below are parsed from
+    programme = Column(String(300))
+    deadline_date = Column(Date, index=True)
     scraped_at = Column(DateTime)
     is_new = Column(Integer, default=1)
 
 class Vacancy(Base):
     __tablename__ = 'vacancies'
+    __table_args__ = {'sqlite_autoincrement': True}
     
     id = Column(Integer, primary_key=True)
     vacancy_hash = Column(String(64), unique=True, index=True)
@@ -44,19 +78,221 @@ class Vacancy(Base):
     title = Column(String(500))
     url = Column(String(1000))
     date = Column(String(100))
-    description = Column(Text)
+    description = Column(CompressedText)
     scraped_at = Column(DateTime)
     is_new = Column(Integer, default=1)  # 1 = new, 0 = seen
 
+class ArchivedHash(Base):
+    """Hash of a row moved to the archive, so re-scraping it doesn't count as new"""
+    __tablename__ = 'archived_hashes'
+    
+    table_name = Column(String(50), primary_key=True)
+    item_hash = Column(String(64), primary_key=True)
+
+class ReadMarker(Base):
+    """Per-subscriber high-water mark: rows with id <= last_seen_id are read
+
+    Relies on ids never being reused, hence AUTOINCREMENT on the history tables.
+    """
+    __tablename__ = 'read_markers'
+    __table_args__ = (UniqueConstraint('subscriber', 'table_name'),)
+    
+    id = Column(Integer, primary_key=True)
+    subscriber = Column(String(100), nullable=False)
+    table_name = Column(String(50), nullable=False)
+    last_seen_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime)
+
+class ScrapeCycle(Base):
+    __tablename__ = 'scrape_cycles'
+    
+    id = Column(Integer, primary_key=True)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    status = Column(String(20), index=True)  # running, completed, abandoned
+    owner = Column(String(100))  # host:pid of the process working on it
+    heartbeat_at = Column(DateTime)
+
+class CycleProgress(Base):
+    """A university whose results were committed during a cycle"""
+    __tablename__ = 'cycle_progress'
+    __table_args__ = (UniqueConstraint('cycle_id', 'university'),)
+    
+    id = Column(Integer, primary_key=True)
+    cycle_id = Column(Integer, nullable=False)
+    university = Column(String(100), nullable=False)
+    completed_at = Column(DateTime)
+
+class PendingNotification(Base):
+    """A new item saved but not yet notified; deleted once sent"""
+    __tablename__ = 'pending_notifications'
+    
+    id = Column(Integer, primary_key=True)
+    cycle_id = Column(Integer)
+    kind = Column(String(20))  # news or deadlines
+    payload = Column(Text)  # JSON of the scraped item dict
+    created_at = Column(DateTime)
+    claimed_by = Column(String(100))  # host:pid of the process sending it
+    claimed_at = Column(DateTime)
+
+# Short names used by the CLI, API and stats engine
+MODELS = {
+    'news': NewsArticle,
+    'deadlines': ApplicationDeadline,
+    'vacancies': Vacancy,
+}
+
+# Unique content hash of each table, used for de-duplication
+HASH_COLUMNS = {
+    'news': 'article_hash',
+    'deadlines': 'deadline_hash',
+    'vacancies': 'vacancy_hash',
+}
+
+# Large free-text column of each table, compressed once rows go cold
+BODY_COLUMNS = {
+    'news': 'content',
+    'deadlines': 'info',
+    'vacancies': 'description',
+}
+
+def process_owner() -> str:
+    """Identify this process as the owner of a scrape cycle"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def _owner_alive(owner: str) -> bool:
+    """False only if the owner is a process on this host that has exited"""
+    host, _, pid = (owner or '').rpartition(':')
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def _enable_incremental_vacuum(dbapi_connection, connection_record):
+    dbapi_connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
 class DatabaseManager:
     def __init__(self, db_url: str = "sqlite:///data/university_data.db"):
         self.engine = create_engine(db_url)
+        if self.engine.dialect.name == 'sqlite':
+            # Only takes effect on a new file (existing ones need a full VACUUM,
+            # see RetentionManager), but then costs nothing
+            event.listen(self.engine, 'connect', _enable_incremental_vacuum)
         Base.metadata.create_all(self.engine)
         self.Session = sessionmaker(bind=self.engine)
+        self._migrate()
+        # Bumped whenever rows are inserted or updated; readers use it to invalidate caches
+        self.data_version = 0
+        self._commit_listeners = []
     
-    def save_news_articles(self, articles: list) -> list:
-        """Save news articles, return only new ones"""
-        session = self.Session()
+    def _migrate(self):
+        """Add columns and indexes introduced after the database was created"""
+        inspector = inspect(self.engine)
+        
+        for table in Base.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            missing = [column for column in table.c if column.name not in existing]
+            
+            with self.engine.begin() as conn:
+                for column in missing:
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+            
+            if missing:
+                logger.info(f"Added columns {[c.name for c in missing]} to {table.name}")
+                if table is ApplicationDeadline.__table__:
+                    self.backfill_deadlines()
+        
+        if self.engine.dialect.name == 'sqlite':
+            for model in MODELS.values():
+                self._ensure_autoincrement(model.__table__)
+    
+    def _ensure_autoincrement(self, table):
+        """Rebuild a table created without AUTOINCREMENT, keeping its rows and ids"""
+        with self.engine.connect() as conn:
+            create_sql = conn.exec_driver_sql(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table.name,)
+            ).scalar()
+        if 'AUTOINCREMENT' in create_sql.upper():
+            return
+        
+        dialect = self.engine.dialect
+        columns = ', '.join(c.name for c in table.c)
+        statements = [f"DROP INDEX IF EXISTS {index.name}" for index in table.indexes]
+        statements += [
+            f"ALTER TABLE {table.name} RENAME TO {table.name}__old",
+            str(CreateTable(table).compile(dialect=dialect)).strip(),
+        ]
+        statements += [str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes]
+        statements += [
+            f"INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {table.name}__old",
+            f"DROP TABLE {table.name}__old",
+        ]
+        
+        # executescript, so the whole rebuild (DDL included) is one transaction
+        raw = self.engine.raw_connection()
+        try:
+            raw.cursor().executescript("BEGIN;\n" + ";\n".join(statements) + ";\nCOMMIT;")
+        finally:
+            raw.close()
+        logger.info(f"Rebuilt {table.name} with AUTOINCREMENT ids")
+    
+    def backfill_deadlines(self) -> int:
+        """Parse dates and programmes for deadlines stored before extraction existed"""
+        table = ApplicationDeadline.__table__
+        
+        with self.engine.begin() as conn:
+            rows = conn.execute(
+                select(table.c.id, table.c.info, table.c.scraped_at).where(table.c.deadline_date.is_(None))
+            ).all()
+            params = []
+            for row_id, info, scraped_at in rows:
+                parsed = extract_deadline(info or '', reference=scraped_at)
+                if parsed['deadline_date']:
+                    params.append({'row_id': row_id, **parsed})
+            if params:
+                conn.execute(
+                    update(table).where(table.c.id == bindparam('row_id'))
+                    .values(deadline_date=bindparam('deadline_date'), programme=bindparam('programme')),
+                    params
+                )
+        
+        logger.info(f"Backfilled {len(params)} of {len(rows)} deadlines")
+        return len(params)
+    
+    def _is_archived(self, session, table_name: str, item_hash: str) -> bool:
+        """True if a row with this hash was moved to the archive"""
+        return session.query(ArchivedHash).filter_by(table_name=table_name, item_hash=item_hash).first() is not None
+    
+    def on_commit(self, callback):
+        """Register a callback run after rows are inserted or updated"""
+        self._commit_listeners.append(callback)
+    
+    def _notify_commit(self, table: str, count: int):
+        """Bump the data version and notify listeners about new or changed rows"""
+        if not count:
+            return
+        self.data_version += 1
+        for callback in self._commit_listeners:
+            try:
+                callback(table, count)
+            except Exception as e:
+                logger.error(f"Commit listener failed: {e}")
+    
+    def save_news_articles(self, articles: list, session=None) -> list:
+        """Save news articles, return only new ones
+        
+        Pass `session` to save as part of a larger transaction; the caller commits.
+        """
+        own_session = session is None
+        session = session or self.Session()
         new_articles = []
         
         for article in articles:
@@ -65,7 +301,7 @@ class DatabaseManager:
             # Check if article already exists
             existing = session.query(NewsArticle).filter_by(article_hash=article_hash).first()
             
-            if not existing:
+            if not existing and not self._is_archived(session, 'news_articles', article_hash):
                 db_article = NewsArticle(
                     article_hash=article_hash,
                     university=article['university'],
@@ -78,13 +314,19 @@ class DatabaseManager:
                 session.add(db_article)
                 new_articles.append(article)
         
-        session.commit()
-        session.close()
+        if own_session:
+            session.commit()
+            session.close()
+            self._notify_commit('news_articles', len(new_articles))
         return new_articles
     
-    def save_deadlines(self, deadlines: list) -> list:
-        """Save application deadlines, return only new ones"""
-        session = self.Session()
+    def save_deadlines(self, deadlines: list, session=None) -> list:
+        """Save application deadlines, return only new ones
+        
+        Pass `session` to save as part of a larger transaction; the caller commits.
+        """
+        own_session = session is None
+        session = session or self.Session()
         new_deadlines = []
         
         for deadline in deadlines:
@@ -93,24 +335,46 @@ class DatabaseManager:
             ).hexdigest()
             
             existing = session.query(ApplicationDeadline).filter_by(deadline_hash=deadline_hash).first()
+            scraped_at = datetime.strptime(deadline['scraped_at'], '%Y-%m-%d %H:%M:%S')
+            if 'deadline_date' in deadline:
+                deadline_date = datetime.strptime(deadline['deadline_date'], '%Y-%m-%d').date() \
+                    if deadline['deadline_date'] else None
+                programme = deadline.get('programme')
+            else:
+                parsed = extract_deadline(deadline['info'], reference=scraped_at)
+                deadline_date, programme = parsed['deadline_date'], parsed['programme']
             
-            if not existing:
+            if existing:
+                # Year-less dates ("Closing date 30 Sept") resolve against the
+                # latest scrape, so a recurring row moves on to this year's date
+                if (existing.deadline_date, existing.programme) != (deadline_date, programme):
+                    existing.deadline_date = deadline_date
+                    existing.programme = programme
+            elif not self._is_archived(session, 'application_deadlines', deadline_hash):
                 db_deadline = ApplicationDeadline(
                     deadline_hash=deadline_hash,
                     university=deadline['university'],
                     info=deadline['info'],
-                    scraped_at=datetime.strptime(deadline['scraped_at'], '%Y-%m-%d %H:%M:%S')
+                    programme=programme,
+                    deadline_date=deadline_date,
+                    scraped_at=scraped_at
                 )
                 session.add(db_deadline)
                 new_deadlines.append(deadline)
         
-        session.commit()
-        session.close()
+        if own_session:
+            session.commit()
+            session.close()
+            self._notify_commit('application_deadlines', len(new_deadlines))
         return new_deadlines
     
-    def save_vacancies(self, vacancies: list) -> list:
-        """Save job vacancies, return only new ones"""
-        session = self.Session()
+    def save_vacancies(self, vacancies: list, session=None) -> list:
+        """Save job vacancies, return only new ones
+        
+        Pass `session` to save as part of a larger transaction; the caller commits.
+        """
+        own_session = session is None
+        session = session or self.Session()
         new_vacancies = []
         
         for vacancy in vacancies:
@@ -120,7 +384,7 @@ class DatabaseManager:
             
             existing = session.query(Vacancy).filter_by(vacancy_hash=vacancy_hash).first()
             
-            if not existing:
+            if not existing and not self._is_archived(session, 'vacancies', vacancy_hash):
                 db_vacancy = Vacancy(
                     vacancy_hash=vacancy_hash,
                     university=vacancy['university'],
@@ -133,10 +397,168 @@ class DatabaseManager:
                 session.add(db_vacancy)
                 new_vacancies.append(vacancy)
         
-        session.commit()
-        session.close()
+        if own_session:
+            session.commit()
+            session.close()
+            self._notify_commit('vacancies', len(new_vacancies))
         return new_vacancies
     
+    @contextmanager
+    def _exclusive(self):
+        """Connection holding the database write lock (BEGIN IMMEDIATE) for the whole block"""
+        with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+            conn.exec_driver_sql("COMMIT")
+    
+    def start_cycle(self, resume: bool = True, max_age_hours: float = 12, owner: str = None,
+                    stale_after_minutes: float = 30) -> tuple:
+        """Claim a cycle for `owner`, return (cycle_id, resumed)
+        
+        Reuses the latest unfinished cycle when resuming. Unfinished cycles
+        older than `max_age_hours` (or all of them when not resuming) are
+        marked abandoned, so their universities are scraped again. Returns
+        (None, False) while another live process is working on a cycle, i.e.
+        its heartbeat is newer than `stale_after_minutes` and, on this host,
+        its process still exists.
+        """
+        owner = owner or process_owner()
+        table = ScrapeCycle.__table__
+        now = datetime.now()
+        cutoff = now - timedelta(hours=max_age_hours)
+        stale = now - timedelta(minutes=stale_after_minutes)
+        
+        with self._exclusive() as conn:
+            running = conn.execute(
+                select(table.c.id, table.c.started_at, table.c.owner, table.c.heartbeat_at)
+                .where(table.c.status == 'running').order_by(table.c.id.desc())
+            ).all()
+            for row in running:
+                if row.owner != owner and row.heartbeat_at and row.heartbeat_at >= stale \
+                        and _owner_alive(row.owner):
+                    logger.warning(f"Cycle {row.id} is being run by {row.owner}; not starting another")
+                    return None, False
+            
+            cycle_id = None
+            abandoned = []
+            for row in running:
+                if resume and cycle_id is None and row.started_at >= cutoff:
+                    cycle_id = row.id
+                else:
+                    abandoned.append(row.id)
+            if abandoned:
+                conn.execute(update(table).where(table.c.id.in_(abandoned))
+                             .values(status='abandoned', finished_at=now))
+                # Pending notifications are kept; only the progress is discarded
+                conn.execute(delete(CycleProgress).where(CycleProgress.cycle_id.in_(abandoned)))
+            
+            resumed = cycle_id is not None
+            if resumed:
+                conn.execute(update(table).where(table.c.id == cycle_id)
+                             .values(owner=owner, heartbeat_at=now))
+            else:
+                cycle_id = conn.execute(table.insert().values(
+                    started_at=now, status='running', owner=owner, heartbeat_at=now
+                )).inserted_primary_key[0]
+            return cycle_id, resumed
+    
+    def heartbeat(self, cycle_id: int, owner: str = None) -> bool:
+        """Refresh a cycle's heartbeat, return False if `owner` no longer holds it"""
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                update(ScrapeCycle).where(ScrapeCycle.id == cycle_id, ScrapeCycle.status == 'running',
+                                          ScrapeCycle.owner == (owner or process_owner()))
+                .values(heartbeat_at=datetime.now())
+            )
+        return result.rowcount == 1
+    
+    def get_completed_universities(self, cycle_id: int) -> set:
+        """Names of universities already committed in a cycle"""
+        with self.engine.connect() as conn:
+            return set(conn.execute(
+                select(CycleProgress.university).where(CycleProgress.cycle_id == cycle_id)
+            ).scalars())
+    
+    def save_university_results(self, cycle_id: int, university: str, articles: list,
+                                deadlines: list, vacancies: list) -> tuple:
+        """Save one university's results, pending notifications and progress in one transaction
+        
+        Returns (new_articles, new_deadlines, new_vacancies). A crash either
+        loses the whole unit, which is then scraped again, or none of it.
+        """
+        session = self.Session()
+        try:
+            new_articles = self.save_news_articles(articles, session)
+            new_deadlines = self.save_deadlines(deadlines, session)
+            new_vacancies = self.save_vacancies(vacancies, session)
+            
+            now = datetime.now()
+            for kind, items in (('news', new_articles), ('deadlines', new_deadlines)):
+                for item in items:
+                    session.add(PendingNotification(
+                        cycle_id=cycle_id, kind=kind, payload=json.dumps(item), created_at=now
+                    ))
+            session.add(CycleProgress(cycle_id=cycle_id, university=university, completed_at=now))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        
+        self._notify_commit('news_articles', len(new_articles))
+        self._notify_commit('application_deadlines', len(new_deadlines))
+        self._notify_commit('vacancies', len(new_vacancies))
+        return new_articles, new_deadlines, new_vacancies
+    
+    def claim_pending_notifications(self, owner: str = None, stale_after_minutes: float = 30) -> dict:
+        """Claim unsent items for `owner`, return them as {'ids', 'news', 'deadlines'}
+        
+        Covers this and any interrupted cycles. Items claimed by another
+        process are skipped unless that claim is older than `stale_after_minutes`,
+        so two processes never send the same item.
+        """
+        owner = owner or process_owner()
+        table = PendingNotification.__table__
+        stale = datetime.now() - timedelta(minutes=stale_after_minutes)
+        
+        with self._exclusive() as conn:
+            conn.execute(
+                update(table)
+                .where((table.c.claimed_by.is_(None)) | (table.c.claimed_by == owner) | (table.c.claimed_at < stale))
+                .values(claimed_by=owner, claimed_at=datetime.now())
+            )
+            rows = conn.execute(
+                select(table.c.id, table.c.kind, table.c.payload)
+                .where(table.c.claimed_by == owner).order_by(table.c.id)
+            ).all()
+        
+        pending = {'ids': [], 'news': [], 'deadlines': []}
+        for row_id, kind, payload in rows:
+            pending['ids'].append(row_id)
+            pending[kind].append(json.loads(payload))
+        return pending
+    
+    def clear_pending_notifications(self, ids: list):
+        """Remove notifications that have been sent"""
+        if not ids:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(delete(PendingNotification).where(PendingNotification.id.in_(ids)))
+    
+    def finish_cycle(self, cycle_id: int):
+        """Mark a cycle completed and drop its progress rows"""
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(ScrapeCycle).where(ScrapeCycle.id == cycle_id)
+                .values(status='completed', finished_at=datetime.now())
+            )
+            conn.execute(delete(CycleProgress).where(CycleProgress.cycle_id == cycle_id))
+    
     def get_recent_news(self, limit: int = 20, university: str = None):
         """Get recent news articles"""
         session = self.Session()
@@ -161,11 +583,139 @@ class DatabaseManager:
         session.close()
         return results
     
+    def get_upcoming_deadlines(self, days: int = 14, university: str = None, limit: int = 100,
+                               start: date = None):
+        """Get deadlines closing between `start` (default today) and `days` later, soonest first"""
+        start = start or date.today()
+        session = self.Session()
+        query = session.query(ApplicationDeadline) \
+            .filter(ApplicationDeadline.deadline_date >= start,
+                    ApplicationDeadline.deadline_date <= start + timedelta(days=days)) \
+            .order_by(ApplicationDeadline.deadline_date, ApplicationDeadline.id)
+        
+        if university:
+            query = query.filter_by(university=university)
+        
+        results = query.limit(limit).all()
+        session.close()
+        return results
+    
+    def get_page(self, model, page: int = 1, per_page: int = 20, university: str = None) -> dict:
+        """Get one page of rows as plain dicts, newest first"""
+        table = model.__table__
+        query = select(table)
+        count_query = select(func.count()).select_from(table)
+        
+        if university:
+            query = query.where(table.c.university == university)
+            count_query = count_query.where(table.c.university == university)
+        
+        query = query.order_by(table.c.scraped_at.desc(), table.c.id.desc()) \
+            .limit(per_page).offset((page - 1) * per_page)
+        
+        with self.engine.connect() as conn:
+            total = conn.execute(count_query).scalar()
+            items = [dict(row._mapping) for row in conn.execute(query)]
+        
+        return {'items': items, 'page': page, 'per_page': per_page, 'total': total}
+    
     def mark_as_seen(self, article_id: int):
         """Mark article as seen/read"""
-        session = self.Session()
-        article = session.query(NewsArticle).filter_by(id=article_id).first()
-        if article:
-            article.is_new = 0
-            session.commit()
-        session.close()
\ No newline at end of file
+        self.mark_seen('news', ids=[article_id])
+    
+    def _seen_filters(self, table, ids=None, university=None, since=None, until=None, up_to_id=None):
+        """WHERE clauses shared by the bulk seen-state operations"""
+        filters = []
+        if ids is not None:
+            filters.append(table.c.id.in_(list(ids)))
+        if university:
+            filters.append(table.c.university == university)
+        if since:
+            filters.append(table.c.scraped_at >= since)
+        if until:
+            filters.append(table.c.scraped_at < until)
+        if up_to_id is not None:
+            filters.append(table.c.id <= up_to_id)
+        return filters
+    
+    def mark_seen(self, name: str, ids=None, university: str = None, since: datetime = None,
+                  until: datetime = None, up_to_id: int = None) -> int:
+        """Clear the global is_new flag in one UPDATE, return the number of rows changed
+        
+        With no filters every row of the table is marked seen.
+        """
+        table = MODELS[name].__table__
+        if ids is not None and not ids:
+            return 0
+        
+        query = update(table) \
+            .where(table.c.is_new == 1, *self._seen_filters(table, ids, university, since, until, up_to_id)) \
+            .values(is_new=0)
+        
+        with self.engine.begin() as conn:
+            count = conn.execute(query).rowcount
+        
+        self._notify_commit(table.name, count)
+        return count
+    
+    def get_read_marker(self, subscriber: str, name: str) -> int:
+        """Return the last id read by a subscriber (0 if it has read nothing)"""
+        with self.engine.connect() as conn:
+            last_seen_id = conn.execute(
+                select(ReadMarker.last_seen_id)
+                .where(ReadMarker.subscriber == subscriber, ReadMarker.table_name == name)
+            ).scalar()
+        return last_seen_id or 0
+    
+    def advance_read_marker(self, subscriber: str, name: str, up_to_id: int = None) -> int:
+        """Move a subscriber's cursor forward (never back), return the new cursor
+        
+        Without `up_to_id` everything currently in the table is marked read.
+        Only sound because ids only grow (AUTOINCREMENT); a reused id would
+        hide a new row behind the cursor.
+        """
+        table = MODELS[name].__table__
+        if up_to_id is None:
+            up_to_id = select(func.coalesce(func.max(table.c.id), 0)).scalar_subquery()
+        
+        query = sqlite_insert(ReadMarker.__table__).values(
+            subscriber=subscriber, table_name=name, last_seen_id=up_to_id, updated_at=datetime.now()
+        )
+        query = query.on_conflict_do_update(
+            index_elements=['subscriber', 'table_name'],
+            set_={
+                'last_seen_id': func.max(ReadMarker.__table__.c.last_seen_id, query.excluded.last_seen_id),
+                'updated_at': query.excluded.updated_at,
+            }
+        )
+        
+        with self.engine.begin() as conn:
+            conn.execute(query)
+        return self.get_read_marker(subscriber, name)
+    
+    def count_unread(self, subscriber: str, name: str, university: str = None) -> int:
+        """Count rows past a subscriber's cursor"""
+        table = MODELS[name].__table__
+        query = select(func.count()).select_from(table) \
+            .where(table.c.id > self._marker_subquery(subscriber, name))
+        if university:
+            query = query.where(table.c.university == university)
+        
+        with self.engine.connect() as conn:
+            return conn.execute(query).scalar()
+    
+    def get_unread(self, subscriber: str, name: str, limit: int = 100, university: str = None) -> list:
+        """Get rows past a subscriber's cursor as plain dicts, oldest first"""
+        table = MODELS[name].__table__
+        query = select(table).where(table.c.id > self._marker_subquery(subscriber, name))
+        if university:
+            query = query.where(table.c.university == university)
+        query = query.order_by(table.c.id).limit(limit)
+        
+        with self.engine.connect() as conn:
+            return [dict(row._mapping) for row in conn.execute(query)]
+    
+    def _marker_subquery(self, subscriber: str, name: str):
+        return select(func.coalesce(func.max(ReadMarker.last_seen_id), 0)) \
+            .where(ReadMarker.subscriber == subscriber, ReadMarker.table_name == name) \
+            .scalar_subquery()
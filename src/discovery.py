@@ -0,0 +1,350 @@
+import json
+import os
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from src.scraper import DEFAULT_HEADERS, DEADLINE_KEYWORDS
+
+logger = logging.getLogger(__name__)
+
+# Candidate paths probed under each university's base URL, in order of preference
+CANDIDATE_PATHS = {
+    'news_url': ['/news', '/news/latest-news', '/media/news', '/newsroom', '/latest-news', '/media-centre/news'],
+    'applications_url': ['/apply', '/applications', '/admissions', '/study/apply', '/study/applications', '/students/admissions'],
+    'vacancies_url': ['/vacancies', '/careers', '/jobs', '/about/vacancies', '/careers/vacancies', '/hr/vacancies'],
+}
+
+# Candidate selectors scored against the fetched section pages
+CANDIDATE_SELECTORS = {
+    'news_articles': ['article', '.news-listing-item', '.news-item', '.views-row', '.post', '.card', 'li.news'],
+    'news_title': ['h2 a', 'h3 a', 'a h2', 'a h3', 'h2', 'h3', 'a'],
+    'news_date': ['time', '.date', '.published', '.news-date', '.post-date'],
+    'news_content': ['.excerpt', '.summary', '.teaser', 'p'],
+    'application_deadlines': ['table tr', '.deadline-table tr', '.table-deadlines tr', 'li', 'p', '.accordion-item'],
+    'vacancies': ['article', '.vacancy', '.job', '.views-row', 'table tr', 'li.vacancy'],
+    'vacancy_title': ['h3 a', 'h2 a', 'a', 'h3', 'h2'],
+    'vacancy_date': ['time', '.date', '.closing-date'],
+    'vacancy_desc': ['.summary', '.description', 'p'],
+}
+
+# Used when none of the candidates match anything on the page
+DEFAULT_SELECTORS = {
+    'news_articles': 'article',
+    'news_title': 'h2, h3',
+    'news_date': '.date, time',
+    'news_content': 'p',
+    'application_deadlines': 'table tr',
+    'vacancies': 'article, .vacancy',
+    'vacancy_title': 'h3, h2, a',
+    'vacancy_date': '.date, time',
+    'vacancy_desc': 'p'
+}
+
+# Selectors that only make sense together: the item container and what is read inside it
+SELECTOR_GROUPS = [
+    ['news_articles', 'news_title', 'news_date', 'news_content'],
+    ['application_deadlines'],
+    ['vacancies', 'vacancy_title', 'vacancy_date', 'vacancy_desc'],
+]
+
+# Listing pages rarely show fewer than two or more than this many items
+MAX_LISTING_ITEMS = 50
+
+
+class DiscoveryCache:
+    """Thread-safe JSON cache of URL probes and selector scores"""
+
+    def __init__(self, path: Optional[str], ttl_hours: float):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.lock = threading.Lock()
+        self.entries = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable discovery cache {path}: {e}")
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry and time.time() - entry['cached_at'] < self.ttl:
+            return entry['value']
+        return None
+
+    def set(self, key: str, value: Dict):
+        with self.lock:
+            self.entries[key] = {'cached_at': time.time(), 'value': value}
+
+    def save(self):
+        """Persist the cache, dropping expired entries"""
+        if not self.path:
+            return
+        now = time.time()
+        with self.lock:
+            entries = {k: v for k, v in self.entries.items() if now - v['cached_at'] < self.ttl}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.path)
+
+
+class UniversityDiscovery:
+    """Find section URLs and scraping selectors for a list of universities"""
+
+    def __init__(self, config, session: Optional[requests.Session] = None, cache_path: Optional[str] = None):
+        self.config = config
+        self.timeout = getattr(config, 'DISCOVERY_TIMEOUT', config.REQUEST_TIMEOUT)
+        self.max_workers = getattr(config, 'DISCOVERY_MAX_WORKERS', 16)
+        self.max_per_host = getattr(config, 'DISCOVERY_MAX_PER_HOST', 2)
+        self._host_slots = {}
+        self._host_lock = threading.Lock()
+        self.cache = DiscoveryCache(
+            cache_path if cache_path is not None else getattr(config, 'DISCOVERY_CACHE_PATH', None),
+            getattr(config, 'DISCOVERY_CACHE_TTL_HOURS', 24)
+        )
+        # A caller-supplied session (e.g. one with a fixture adapter mounted) is shared by all workers
+        self._shared_session = session
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """Return the shared session, or a per-thread one"""
+        if self._shared_session is not None:
+            return self._shared_session
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+            self._local.session.headers.update(DEFAULT_HEADERS)
+        return self._local.session
+
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        """Semaphore limiting concurrent requests to one host"""
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def probe(self, url: str) -> Optional[str]:
+        """Check that a URL is reachable, returning the final URL after redirects"""
+        cached = self.cache.get(f"probe:{url}")
+        if cached is not None:
+            return cached['url']
+
+        try:
+            with self._host_slot(url):
+                response = self._session().head(url, timeout=self.timeout, allow_redirects=True)
+                # Plenty of sites reject HEAD outright, so fall back to GET
+                if response.status_code in (403, 405, 501):
+                    response = self._session().get(url, timeout=self.timeout, stream=True)
+                    response.close()
+        except requests.RequestException as e:
+            # Timeouts and connection errors may be transient, so they are not cached
+            logger.debug(f"Probe failed for {url}: {e}")
+            return None
+
+        final_url = None
+        content_type = response.headers.get('Content-Type', 'text/html')
+        if response.ok and 'html' in content_type:
+            final_url = response.url
+        elif response.status_code >= 500 or response.status_code == 429:
+            # Server trouble or rate limiting: not a definitive answer either
+            return None
+
+        self.cache.set(f"probe:{url}", {'url': final_url})
+        return final_url
+
+    def fetch(self, url: str) -> Optional[str]:
+        """Fetch a page body for selector scoring"""
+        try:
+            with self._host_slot(url):
+                response = self._session().get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            logger.debug(f"Fetch failed for {url}: {e}")
+            return None
+
+    def discover(self, universities: List[Dict]) -> List[Dict]:
+        """Build university configs from seeds with 'name' and 'base_url'
+
+        Only sections whose URL answered are filled in; the others are None.
+        Universities with no reachable section at all are left out.
+        """
+        start = time.time()
+
+        # Probe every candidate URL of every institution in one pool, interleaved
+        # across institutions so consecutive requests go to different hosts
+        candidates = [
+            (field, path) for field, paths in CANDIDATE_PATHS.items() for path in paths
+        ]
+        probes = []
+        for field, path in candidates:
+            for uni in universities:
+                probes.append((uni['name'], field, uni['base_url'].rstrip('/') + path))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda p: self.probe(p[2]), probes))
+
+        # Keep the first reachable candidate per section, in preference order
+        section_urls = {}
+        for (name, field, _), final_url in zip(probes, results):
+            if final_url and (name, field) not in section_urls:
+                section_urls[(name, field)] = final_url
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            scored = dict(zip(
+                section_urls.keys(),
+                executor.map(lambda item: self.score_page(item[0][1], item[1]), section_urls.items())
+            ))
+
+        discovered = []
+        for uni in universities:
+            name = uni['name']
+            if not any((name, field) in section_urls for field in CANDIDATE_PATHS):
+                logger.warning(f"No reachable section pages for {name}, skipping")
+                continue
+
+            selectors = dict(DEFAULT_SELECTORS)
+            for field in CANDIDATE_PATHS:
+                selectors.update(scored.get((name, field), {}))
+
+            discovered.append({
+                'name': name,
+                'base_url': uni['base_url'],
+                'news_url': section_urls.get((name, 'news_url')),
+                'applications_url': section_urls.get((name, 'applications_url')),
+                'vacancies_url': section_urls.get((name, 'vacancies_url')),
+                'selectors': selectors
+            })
+
+        self.cache.save()
+        logger.info(f"Discovered {len(section_urls)} section pages for {len(universities)} universities "
+                    f"in {time.time() - start:.1f}s")
+        return discovered
+
+    def score_page(self, field: str, url: str) -> Dict:
+        """Pick the best scoring selectors for a section page"""
+        cached = self.cache.get(f"selectors:{url}")
+        if cached is not None:
+            return cached
+
+        html = self.fetch(url)
+        if not html:
+            return {}
+        soup = BeautifulSoup(html, 'lxml')
+
+        if field == 'news_url':
+            selectors = self._score_listing(soup, 'news_articles', 'news_title', 'news_date', 'news_content')
+        elif field == 'vacancies_url':
+            selectors = self._score_listing(soup, 'vacancies', 'vacancy_title', 'vacancy_date', 'vacancy_desc')
+        else:
+            selectors = self._score_deadlines(soup)
+
+        self.cache.set(f"selectors:{url}", selectors)
+        return selectors
+
+    def _score_listing(self, soup, items_key: str, title_key: str, date_key: str, body_key: str) -> Dict:
+        """Score container/title/date/body selector combinations for a listing page"""
+        best_score, best = 0.0, {}
+
+        for container in CANDIDATE_SELECTORS[items_key]:
+            elements = soup.select(container)[:MAX_LISTING_ITEMS]
+            if len(elements) < 2:
+                continue
+
+            title, title_rate = self._best_child_selector(elements, CANDIDATE_SELECTORS[title_key], needs_link=True)
+            if not title:
+                continue
+            date, date_rate = self._best_child_selector(elements, CANDIDATE_SELECTORS[date_key])
+            body, body_rate = self._best_child_selector(elements, CANDIDATE_SELECTORS[body_key])
+
+            score = len(elements) * (title_rate + 0.5 * date_rate + 0.25 * body_rate)
+            if score > best_score:
+                best_score = score
+                best = {items_key: container, title_key: title}
+                if date:
+                    best[date_key] = date
+                if body:
+                    best[body_key] = body
+
+        return best
+
+    def _best_child_selector(self, elements, candidates: List[str], needs_link: bool = False) -> Tuple[Optional[str], float]:
+        """Return the candidate matching non-empty text in the largest share of elements"""
+        best, best_rate = None, 0.0
+
+        for selector in candidates:
+            hits = 0
+            for element in elements:
+                child = element.select_one(selector)
+                if child and child.get_text(strip=True):
+                    # The scraper takes the item URL from the title element's href
+                    hits += 1 if not needs_link or child.get('href') else 0.5
+            rate = hits / len(elements)
+            if rate > best_rate:
+                best, best_rate = selector, rate
+
+        return best, best_rate
+
+    def _score_deadlines(self, soup) -> Dict:
+        """Pick the deadline row selector with the most keyword matches"""
+        best, best_hits = None, 0
+
+        for selector in CANDIDATE_SELECTORS['application_deadlines']:
+            hits = sum(
+                1 for element in soup.select(selector)
+                if any(keyword in element.get_text(strip=True).lower() for keyword in DEADLINE_KEYWORDS)
+            )
+            if hits > best_hits:
+                best, best_hits = selector, hits
+
+        return {'application_deadlines': best} if best else {}
+
+    def merge_into_file(self, discovered: List[Dict], path: str = 'data/universities.json') -> Tuple[int, int]:
+        """Merge discovered configs into the universities file, return (added, updated)"""
+        existing = []
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                existing = json.load(f).get('universities', [])
+
+        by_name = {uni['name']: uni for uni in existing}
+        added = updated = 0
+
+        for uni in discovered:
+            current = by_name.get(uni['name'])
+            if current is None:
+                existing.append(uni)
+                by_name[uni['name']] = uni
+                added += 1
+                continue
+
+            # Hand-tuned entries win; only fill in what is missing
+            changed = False
+            for key, value in uni.items():
+                if key == 'selectors':
+                    selectors = current.setdefault('selectors', {})
+                    for group in SELECTOR_GROUPS:
+                        # Child selectors were scored against the discovered container,
+                        # so they are only taken together with it
+                        if not selectors.get(group[0]) and value.get(group[0]):
+                            selectors.update({k: value[k] for k in group if k in value})
+                            changed = True
+                elif not current.get(key) and value:
+                    current[key] = value
+                    changed = True
+            updated += changed
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'universities': existing}, f, indent=4)
+        os.replace(tmp_path, path)
+
+        return added, updated
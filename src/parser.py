@@ -0,0 +1,162 @@
+import re
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+_MONTH = r'(?P<month>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?'
+_DAY = r'(?P<day>[0-3]?\d)(?:st|nd|rd|th)?'
+_YEAR = r'(?P<year>(?:19|20)\d{2})'
+
+# Tried in order; lookarounds instead of \b because scraped cell text is often glued together
+DATE_PATTERNS = [
+    # 2026-09-30, 2026/09/30, 2026.09.30
+    re.compile(r'(?<!\d)(?P<year>(?:19|20)\d{2})(?P<sep>[-/.])(?P<month>[01]?\d)(?P=sep)(?P<day>[0-3]?\d)(?!\d)'),
+    # 30/09/2026, 30.09.2026 (day first, as used in South Africa)
+    re.compile(r'(?<!\d)(?P<day>[0-3]?\d)[/.](?P<month>[01]?\d)[/.](?P<year>(?:19|20)\d{2})(?!\d)'),
+    # 30 September 2026, 30 Sept, 30th of September
+    re.compile(r'(?<!\d)' + _DAY + r'\s*(?:of\s+)?' + _MONTH + r'(?![a-z])(?:,?\s*' + _YEAR + r')?', re.IGNORECASE),
+    # September 30, 2026
+    re.compile(r'(?<![a-z])' + _MONTH + r'\s*' + _DAY + r'(?!\d)(?:,?\s*' + _YEAR + r')?', re.IGNORECASE),
+]
+
+# Month names that are also ordinary words ("Grade 12 may apply")
+AMBIGUOUS_MONTHS = {'may', 'march'}
+
+WEEKDAY_PATTERN = re.compile(
+    r'(?<![a-z])(?:(?:mon|tues|wednes|thurs|fri|satur|sun)day|(?:mon|tue|wed|thu|fri|sat|sun)\.)[\s,.]*$',
+    re.IGNORECASE
+)
+
+# Phrasing around dates that is never the programme name: "Opens 1 May",
+# "applications open on", "Open Day:", "Due to high demand,"
+NOISE_PATTERN = re.compile(
+    r'(?<![a-z])(?:(?:opens?|opening(?:\s+date)?)(?:\s+(?:on|from))?(?![a-z])|due\s+to\s[^,.;:]*[,.;:]?)',
+    re.IGNORECASE
+)
+
+# Words that can be left over once dates and keywords are removed; a
+# "programme" made only of these is dropped
+FILLER_WORDS = {
+    'day', 'date', 'dates', 'application', 'applications', 'extended', 'is', 'on', 'by', 'to',
+    'for', 'from', 'until', 'the', 'of', 'and', 'at', 'in', 'all',
+}
+
+KEYWORD_PATTERN = re.compile(
+    r'(?<![a-z])(?:closing\s+date|deadlines?|close[sd]?|closing|apply\s+by|due(?!\s+to(?![a-z]))(?:\s+date)?)'
+    r'(?![a-z])\s*(?:is|on|:|-|–)?\s*',
+    re.IGNORECASE
+)
+
+
+def find_dates(text: str, reference: Optional[datetime] = None) -> List[Dict]:
+    """Find every date in `text`, return dicts with 'date', 'start' and 'end'
+
+    Dates without a year get the year that puts them closest to `reference`
+    (usually when the page was scraped), so a deadline that just passed
+    stays in the past. A lowercase "may" without a year followed by another
+    lowercase word is read as the verb, not the month.
+    """
+    if reference is None:
+        reference = date.today()
+    elif isinstance(reference, datetime):
+        reference = reference.date()
+    found = []
+    taken = []
+
+    for pattern in DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            if any(start < match.end() and match.start() < end for start, end in taken):
+                continue
+            if _is_ambiguous(match, text):
+                continue
+            parsed = _to_date(match, reference)
+            if parsed:
+                found.append({'date': parsed, 'start': match.start(), 'end': match.end()})
+                taken.append((match.start(), match.end()))
+
+    return sorted(found, key=lambda d: d['start'])
+
+
+def _is_ambiguous(match, text: str) -> bool:
+    month = match.group('month').rstrip('.')
+    return (month in AMBIGUOUS_MONTHS and not match.group('year')
+            and re.match(r'\s+[a-z]', text[match.end():]) is not None)
+
+
+def _to_date(match, reference: date) -> Optional[date]:
+    month = match.group('month')
+    month = int(month) if month.isdigit() else MONTHS[month[:3].lower()]
+    day = int(match.group('day'))
+    year = match.group('year')
+
+    if year:
+        try:
+            return date(int(year), month, day)
+        except ValueError:
+            return None
+
+    candidates = []
+    for candidate_year in (reference.year - 1, reference.year, reference.year + 1):
+        try:
+            candidates.append(date(candidate_year, month, day))
+        except ValueError:
+            continue
+    if not candidates:
+        return None
+    return min(candidates, key=lambda d: abs((d - reference).days))
+
+
+def extract_deadline(text: str, cells: Optional[List[str]] = None, reference: Optional[datetime] = None) -> Dict:
+    """Pull a deadline date and programme name out of a deadline row
+
+    `cells` are the row's table cells, when there are any; a cell without a
+    date is taken as the programme name. Returns 'deadline_date' and
+    'programme', either of which may be None.
+    """
+    dates = find_dates(text, reference)
+    if not dates:
+        return {'deadline_date': None, 'programme': None}
+
+    # Prefer the first date after a deadline keyword, e.g. "Opens 1 May, closes 30 Sept"
+    deadline = dates[0]
+    keyword = KEYWORD_PATTERN.search(text)
+    if keyword:
+        after = [d for d in dates if d['start'] >= keyword.start()]
+        if after:
+            deadline = after[0]
+
+    programme = None
+    if cells:
+        for cell in cells:
+            if cell and not find_dates(cell, reference) and not KEYWORD_PATTERN.fullmatch(cell):
+                programme = cell
+                break
+    else:
+        # Text before the keyword, e.g. "MBA applications - closing date: 30 Sept 2026",
+        # minus any opening date: "Opens 1 May 2026, closes 30 September 2026"
+        end = keyword.start() if keyword else dates[0]['start']
+        prefix = text[:end]
+        for found in reversed(find_dates(prefix, reference)):
+            prefix = prefix[:found['start']] + prefix[found['end']:]
+        programme = _clean_programme(NOISE_PATTERN.sub('', prefix))
+        if not programme and keyword and keyword.end() < deadline['start']:
+            # Or between them, e.g. "Closing date for Engineering is 31 May"
+            between = NOISE_PATTERN.sub('', text[keyword.end():deadline['start']]).strip()
+            programme = _clean_programme(re.sub(r'^for\s+|\s+(?:is|on)\s*$', '', between))
+
+    return {'deadline_date': deadline['date'], 'programme': _clean_programme(programme)}
+
+
+def _clean_programme(text: Optional[str]) -> Optional[str]:
+    if not text:
+        return None
+    text = WEEKDAY_PATTERN.sub('', re.sub(r'\s+', ' ', text))
+    text = re.sub(r'^[\s:;,.\-–|]+|[\s:;,.\-–|]+$', '', text)
+    words = re.findall(r'[a-z0-9]+', text.lower())
+    if all(word in FILLER_WORDS for word in words):
+        return None
+    return text[:300]
@@ -0,0 +1,222 @@
+import time
+import zlib
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, update, bindparam, func, or_, LargeBinary
+from sqlalchemy.engine import make_url
+
+from src.database import DatabaseManager, ArchivedHash, MODELS, BODY_COLUMNS, HASH_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# SQLite's PRAGMA auto_vacuum value for INCREMENTAL
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+class RetentionManager:
+    """Age/count retention, cold body compression, archiving and incremental VACUUM
+
+    Every step works in small batches, each in its own short transaction, and
+    stops once the time budget of the run is spent, so a scheduled run never
+    holds the write lock for long. Whatever is left is picked up next run.
+    """
+
+    def __init__(self, db_manager, config):
+        self.db_manager = db_manager
+        self.engine = db_manager.engine
+        self.policies: Dict[str, Dict] = config.RETENTION_POLICIES
+        self.archive_url = config.ARCHIVE_DATABASE_URL
+        self.batch_size = config.RETENTION_BATCH_SIZE
+        self.min_compress_length = config.RETENTION_MIN_COMPRESS_LENGTH
+        self.vacuum_pages = config.RETENTION_VACUUM_PAGES
+        self.interval_minutes = config.RETENTION_INTERVAL_MINUTES
+        self.time_budget = config.RETENTION_TIME_BUDGET
+        self._archive_ready = False
+        self._archive_engine = None
+        self._vacuum_warned = set()
+
+    def run_maintenance(self, time_budget: Optional[float] = None, full_vacuum: bool = False) -> Dict[str, int]:
+        """Run one maintenance pass; `time_budget=None` runs every step to completion"""
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+        stats = {'archived': 0, 'compressed': 0, 'vacuumed_pages': 0}
+
+        for name in MODELS:
+            policy = self.policies.get(name, {})
+            stats['archived'] += self.archive_expired(name, policy, deadline)
+            stats['compressed'] += self.compress_cold(name, policy, deadline)
+
+        stats['vacuumed_pages'] = self.incremental_vacuum(deadline, full_vacuum)
+        if self._archive_ready:
+            stats['vacuumed_pages'] += self.incremental_vacuum(deadline, full_vacuum, self._archive_engine)
+
+        if any(stats.values()):
+            logger.info(f"Maintenance: archived {stats['archived']} rows, compressed {stats['compressed']} bodies, "
+                        f"freed {stats['vacuumed_pages']} pages")
+        return stats
+
+    def _expired(self, deadline: Optional[float]) -> bool:
+        return deadline is not None and time.monotonic() >= deadline
+
+    def _expiry_filters(self, table, policy: Dict) -> List:
+        """WHERE clauses selecting rows past the age or count limit"""
+        filters = []
+        if policy.get('max_age_days'):
+            cutoff = datetime.now() - timedelta(days=policy['max_age_days'])
+            filters.append(table.c.scraped_at < cutoff)
+        if policy.get('max_rows'):
+            # Everything older than the newest `max_rows` rows
+            boundary = select(table.c.id).order_by(table.c.id.desc()) \
+                .offset(policy['max_rows'] - 1).limit(1).scalar_subquery()
+            filters.append(table.c.id < boundary)
+        return filters
+
+    def archive_expired(self, name: str, policy: Dict, deadline: Optional[float] = None) -> int:
+        """Move expired rows into the archive database, return rows moved
+
+        Rows are archived without their live id (the archive assigns its own)
+        and keyed by content hash, which is also recorded in the live
+        database so a re-scraped archived item isn't saved as new again.
+        """
+        table = MODELS[name].__table__
+        hash_column = HASH_COLUMNS[name]
+        filters = self._expiry_filters(table, policy)
+        if not filters:
+            return 0
+
+        self._ensure_archive()
+        names = [c.name for c in table.c if c.name != 'id']
+        columns = ', '.join(names)
+        # A re-archived hash replaces the older archived copy
+        updates = ', '.join(f"{c} = excluded.{c}" for c in names if c != hash_column)
+        moved = 0
+
+        with self.engine.connect() as conn:
+            # ATTACH must happen outside a transaction; DML below starts one per batch
+            conn.exec_driver_sql("ATTACH DATABASE ? AS archive", (make_url(self.archive_url).database,))
+            try:
+                while not self._expired(deadline):
+                    ids = conn.execute(
+                        select(table.c.id).where(or_(*filters), table.c[hash_column].isnot(None))
+                        .order_by(table.c.id).limit(self.batch_size)
+                    ).scalars().all()
+                    if not ids:
+                        break
+
+                    placeholders = ', '.join('?' * len(ids))
+                    conn.exec_driver_sql(
+                        f"INSERT INTO archive.{table.name} ({columns}) "
+                        f"SELECT {columns} FROM main.{table.name} WHERE id IN ({placeholders}) "
+                        f"ON CONFLICT({hash_column}) DO UPDATE SET {updates}",
+                        tuple(ids)
+                    )
+                    conn.exec_driver_sql(
+                        f"INSERT OR IGNORE INTO main.{ArchivedHash.__tablename__} (table_name, item_hash) "
+                        f"SELECT ?, {hash_column} FROM main.{table.name} WHERE id IN ({placeholders})",
+                        (table.name, *ids)
+                    )
+                    # Only delete what is now in the archive
+                    result = conn.exec_driver_sql(
+                        f"DELETE FROM main.{table.name} WHERE id IN ({placeholders}) "
+                        f"AND {hash_column} IN (SELECT {hash_column} FROM archive.{table.name})",
+                        tuple(ids)
+                    )
+                    conn.commit()
+                    if result.rowcount < len(ids):
+                        logger.warning(f"{len(ids) - result.rowcount} {table.name} rows missing from archive; kept")
+                        moved += result.rowcount
+                        break
+                    moved += result.rowcount
+            finally:
+                conn.rollback()
+                conn.exec_driver_sql("DETACH DATABASE archive")
+
+        if moved:
+            self.db_manager._notify_commit(table.name, moved)
+        return moved
+
+    def _ensure_archive(self):
+        """Create the archive database with the same schema as the live one"""
+        if not self._archive_ready:
+            self._archive_engine = DatabaseManager(self.archive_url).engine
+            self._archive_ready = True
+
+    def compress_cold(self, name: str, policy: Dict, deadline: Optional[float] = None) -> int:
+        """Compress body text of rows older than `compress_after_days`, return rows compressed"""
+        compressed = 0
+        if policy.get('compress_after_days'):
+            cutoff = datetime.now() - timedelta(days=policy['compress_after_days'])
+            compressed += self._compress_bodies(self.engine, name, cutoff, deadline)
+        if self._archive_ready:
+            # Archived rows are cold by definition
+            compressed += self._compress_bodies(self._archive_engine, name, datetime.max, deadline)
+        return compressed
+
+    def _compress_bodies(self, engine, name: str, cutoff: datetime, deadline: Optional[float]) -> int:
+        table = MODELS[name].__table__
+        body = table.c[BODY_COLUMNS[name]]
+        # Bind raw bytes, bypassing CompressedText, so the BLOB is stored as-is
+        query = update(table).where(table.c.id == bindparam('row_id')) \
+            .values({body.name: bindparam('body', type_=LargeBinary)})
+        last_id = 0
+        compressed = 0
+
+        while not self._expired(deadline):
+            with engine.begin() as conn:
+                rows = conn.execute(
+                    select(table.c.id, body)
+                    .where(table.c.id > last_id, table.c.scraped_at < cutoff,
+                           func.typeof(body) == 'text', func.length(body) >= self.min_compress_length)
+                    .order_by(table.c.id).limit(self.batch_size)
+                ).all()
+                if not rows:
+                    break
+
+                params = []
+                for row_id, text in rows:
+                    raw = text.encode('utf-8')
+                    blob = zlib.compress(raw, 9)
+                    if len(blob) < len(raw):
+                        params.append({'row_id': row_id, 'body': blob})
+                if params:
+                    conn.execute(query, params)
+                compressed += len(params)
+                last_id = rows[-1][0]
+
+        return compressed
+
+    def incremental_vacuum(self, deadline: Optional[float] = None, full_vacuum: bool = False, engine=None) -> int:
+        """Release free pages a few at a time, return pages released
+
+        New databases are created with incremental auto-vacuum (see
+        DatabaseManager). Switching an existing one needs a full VACUUM,
+        which is only done when `full_vacuum` is requested.
+        """
+        engine = engine or self.engine
+        conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            if conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() != AUTO_VACUUM_INCREMENTAL:
+                if not full_vacuum:
+                    if engine.url.database not in self._vacuum_warned:
+                        logger.warning(f"auto_vacuum is not INCREMENTAL on {engine.url.database}; "
+                                       f"skipping vacuum until --maintenance is run once")
+                        self._vacuum_warned.add(engine.url.database)
+                    return 0
+                logger.info(f"Switching {engine.url.database} to incremental auto-vacuum (full VACUUM)")
+                conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.exec_driver_sql("VACUUM")
+
+            released = 0
+            while not self._expired(deadline):
+                free = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+                if not free:
+                    break
+                conn.exec_driver_sql(f"PRAGMA incremental_vacuum({self.vacuum_pages})")
+                remaining = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+                if remaining >= free:
+                    break
+                released += free - remaining
+            return released
+        finally:
+            conn.close()
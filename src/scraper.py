@@ -2,28 +2,83 @@ import requests
 from bs4 import BeautifulSoup
 import time
 import logging
+import threading
 from typing import Optional, Dict, List
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from src.parser import extract_deadline
+
+try:
+    import psutil
+except ImportError:  # Optional: only needed for the browser memory cap
+    psutil = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+DEADLINE_KEYWORDS = ['deadline', 'closing', 'apply by', 'due']
+
+class BrowserMemoryWatchdog(threading.Thread):
+    """Kill a browser's whole process tree once its resident memory exceeds a cap"""
+    
+    def __init__(self, root_pid: int, max_memory_mb: int, interval: float = 0.5):
+        super().__init__(daemon=True)
+        self.root_pid = root_pid
+        self.max_bytes = max_memory_mb * 1024 * 1024
+        self.interval = interval
+        self.killed = False
+        self._stopped = threading.Event()
+    
+    def stop(self):
+        self._stopped.set()
+    
+    def run(self):
+        try:
+            root = psutil.Process(self.root_pid)
+        except psutil.NoSuchProcess:
+            return
+        
+        while not self._stopped.wait(self.interval):
+            try:
+                processes = [root] + root.children(recursive=True)
+            except psutil.NoSuchProcess:
+                return
+            
+            rss = 0
+            for process in processes:
+                try:
+                    rss += process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            
+            if rss > self.max_bytes:
+                logger.warning(f"Browser using {rss // (1024 * 1024)} MB, killing process tree")
+                self.killed = True
+                # Children first so the driver can't respawn them
+                for process in reversed(processes):
+                    try:
+                        process.kill()
+                    except psutil.NoSuchProcess:
+                        continue
+                return
+
 class UniversityScraper:
     def __init__(self, config):
         self.config = config
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        self.session.headers.update(DEFAULT_HEADERS)
         
     def fetch_page(self, url: str, use_selenium: bool = False) -> Optional[str]:
         """Fetch webpage content"""
@@ -40,6 +95,44 @@ class UniversityScraper:
     
     def _fetch_with_selenium(self, url: str) -> Optional[str]:
         """Use Selenium for JavaScript-heavy sites"""
+        driver = webdriver.Chrome(options=self._chrome_options())
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        watchdog = None
+        try:
+            if self.config.SELENIUM_LIGHTWEIGHT:
+                self._block_requests(driver)
+                watchdog = self._start_memory_watchdog(driver)
+            driver.set_page_load_timeout(self.config.SELENIUM_PAGE_LOAD_TIMEOUT)
+            
+            try:
+                driver.get(url)
+                # Wait for content to load
+                WebDriverWait(driver, 20).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+                time.sleep(self.config.SELENIUM_SETTLE_SECONDS)  # Additional wait for dynamic content
+            except TimeoutException:
+                logger.warning(f"Timeout loading {url}")
+            
+            if watchdog and watchdog.killed:
+                return None
+            return driver.page_source
+        except Exception as e:
+            if watchdog and watchdog.killed:
+                logger.error(f"Browser killed for exceeding {self.config.SELENIUM_MAX_MEMORY_MB} MB on {url}")
+            else:
+                logger.error(f"Selenium error: {e}")
+            return None
+        finally:
+            if watchdog:
+                watchdog.stop()
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+    
+    def _chrome_options(self) -> webdriver.ChromeOptions:
+        """Build Chrome options, using the lightweight profile if enabled"""
         options = webdriver.ChromeOptions()
         options.add_argument('--headless')  # Run in background
         options.add_argument('--no-sandbox')
@@ -47,29 +140,50 @@ class UniversityScraper:
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        options.add_argument(f"--user-agent={DEFAULT_HEADERS['User-Agent']}")
         
-        driver = webdriver.Chrome(options=options)
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.config.SELENIUM_LIGHTWEIGHT:
+            options.page_load_strategy = self.config.SELENIUM_PAGE_LOAD_STRATEGY
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--disable-extensions')
+            options.add_argument('--disable-gpu')
+            options.add_argument('--mute-audio')
+            options.add_argument('--disable-background-networking')
+            options.add_argument('--disable-component-update')
+            options.add_argument('--renderer-process-limit=2')
+            options.add_argument(f'--js-flags=--max-old-space-size={self.config.SELENIUM_JS_HEAP_MB}')
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.media_stream': 2,
+                'profile.default_content_setting_values.notifications': 2,
+            })
+        
+        return options
+    
+    def _block_requests(self, driver):
+        """Block images, media, fonts and trackers at the network layer"""
         try:
-            driver.get(url)
-            # Wait for content to load
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(5)  # Additional wait for dynamic content
-            return driver.page_source
-        except TimeoutException:
-            logger.warning(f"Timeout loading {url}")
-            return driver.page_source
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.config.SELENIUM_BLOCKED_URLS})
         except Exception as e:
-            logger.error(f"Selenium error: {e}")
+            logger.warning(f"Could not enable request blocking: {e}")
+    
+    def _start_memory_watchdog(self, driver) -> Optional['BrowserMemoryWatchdog']:
+        """Watch the browser's process tree and kill it past the memory cap"""
+        if not self.config.SELENIUM_MAX_MEMORY_MB:
             return None
-        finally:
-            driver.quit()
+        if psutil is None:
+            logger.warning("psutil is not installed; browser memory cap disabled")
+            return None
+        
+        watchdog = BrowserMemoryWatchdog(driver.service.process.pid, self.config.SELENIUM_MAX_MEMORY_MB)
+        watchdog.start()
+        return watchdog
     
     def scrape_news(self, university_config) -> List[Dict]:
         """Scrape news articles from university website"""
+        if not university_config.news_url:
+            return []
         html = self.fetch_page(university_config.news_url, use_selenium=True)
         if not html:
             return []
@@ -114,6 +228,8 @@ class UniversityScraper:
     
     def scrape_applications(self, university_config) -> List[Dict]:
         """Scrape application information and deadlines"""
+        if not university_config.applications_url:
+            return []
         html = self.fetch_page(university_config.applications_url, use_selenium=True)
         if not html:
             return []
@@ -128,10 +244,15 @@ class UniversityScraper:
             try:
                 # Extract text and look for date patterns
                 text = element.get_text(strip=True)
-                if any(keyword in text.lower() for keyword in ['deadline', 'closing', 'apply by', 'due']):
+                if any(keyword in text.lower() for keyword in DEADLINE_KEYWORDS):
+                    # `info` keeps the original text (it is hashed); parse a spaced version
+                    cells = [cell.get_text(' ', strip=True) for cell in element.find_all(['td', 'th'])]
+                    parsed = extract_deadline(element.get_text(' ', strip=True), cells)
                     deadline = {
                         'university': university_config.name,
                         'info': text,
+                        'programme': parsed['programme'],
+                        'deadline_date': parsed['deadline_date'].isoformat() if parsed['deadline_date'] else None,
                         'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
                     }
                     deadlines.append(deadline)
@@ -143,8 +264,9 @@ class UniversityScraper:
     
     def scrape_vacancies(self, university_config) -> List[Dict]:
         """Scrape job vacancies from university website"""
-        vacancies_url = university_config.vacancies_url or (university_config.base_url + '/vacancies')
-        html = self.fetch_page(vacancies_url, use_selenium=True)
+        if not university_config.vacancies_url:
+            return []
+        html = self.fetch_page(university_config.vacancies_url, use_selenium=True)
         if not html:
             return []
         
@@ -182,7 +304,7 @@ class UniversityScraper:
         return vacancies
     
     def get_south_african_universities(self) -> List[Dict]:
-        """Scrape list of South African universities from Wikipedia"""
+        """Scrape list of South African universities (name and website) from Wikipedia"""
         url = "https://en.wikipedia.org/wiki/List_of_universities_in_South_Africa"
         html = self.fetch_page(url)
         if not html:
@@ -208,23 +330,10 @@ class UniversityScraper:
                     if not site_url.startswith('http'):
                         site_url = 'https:' + site_url
                     
+                    # Section URLs and selectors are filled in by UniversityDiscovery
                     universities.append({
                         'name': name,
-                        'base_url': site_url,
-                        'news_url': site_url + '/news',
-                        'applications_url': site_url + '/apply',
-                        'vacancies_url': site_url + '/vacancies',
-                        'selectors': {
-                            'news_articles': 'article',
-                            'news_title': 'h2, h3',
-                            'news_date': '.date, time',
-                            'news_content': 'p',
-                            'application_deadlines': 'table tr',
-                            'vacancies': 'article, .vacancy',
-                            'vacancy_title': 'h3, h2, a',
-                            'vacancy_date': '.date, time',
-                            'vacancy_desc': 'p'
-                        }
+                        'base_url': site_url.rstrip('/')
                     })
         
         return universities
\ No newline at end of file
@@ -0,0 +1,183 @@
+import os
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+from sqlalchemy import select
+
+from src.database import MODELS
+
+logger = logging.getLogger(__name__)
+
+# Tables covered by the stats engine, keyed by the name used in reports and exports
+TABLES = {name: model.__table__ for name, model in MODELS.items()}
+
+# Only these columns are needed for aggregates; exports stream every column
+STATS_COLUMNS = ['id', 'university', 'scraped_at', 'is_new']
+
+
+def last_days(daily: pd.DataFrame, days: int, today: date = None) -> pd.DataFrame:
+    """The last `days` calendar days of `daily_counts()`, with 0 for days nothing was scraped"""
+    end = pd.Period(today or date.today(), freq='D')
+    index = pd.period_range(end=end, periods=days, freq='D', name='period')
+    return daily.reindex(index, fill_value=0).astype(int)
+
+
+class StatsEngine:
+    """Columnar aggregates and exports over the scraped history tables"""
+
+    def __init__(self, db_manager, chunksize: int = 10000):
+        self.engine = db_manager.engine
+        self.chunksize = chunksize
+
+    def iter_chunks(self, table_name: str, columns: Optional[List[str]] = None,
+                    university: str = None) -> Iterator[pd.DataFrame]:
+        """Stream a table as DataFrames of at most `chunksize` rows"""
+        table = TABLES[table_name]
+        cols = [table.c[name] for name in columns] if columns else list(table.c)
+        query = select(*cols).order_by(table.c.id)
+        if university:
+            query = query.where(table.c.university == university)
+
+        with self.engine.connect() as conn:
+            for chunk in pd.read_sql(query, conn, chunksize=self.chunksize, parse_dates=['scraped_at']):
+                yield chunk
+
+    def university_summary(self, table_name: str, university: str = None) -> pd.DataFrame:
+        """Per-university totals, new-vs-seen ratio and posting rate (items/day)"""
+        partials = []
+        for chunk in self.iter_chunks(table_name, STATS_COLUMNS, university):
+            partials.append(chunk.groupby('university').agg(
+                total=('id', 'size'),
+                new=('is_new', 'sum'),
+                first_seen=('scraped_at', 'min'),
+                last_seen=('scraped_at', 'max'),
+            ))
+
+        if not partials:
+            return pd.DataFrame(columns=['total', 'new', 'seen', 'new_ratio', 'first_seen', 'last_seen', 'per_day'])
+
+        # Combine per-chunk partial aggregates
+        summary = pd.concat(partials).groupby(level=0).agg(
+            {'total': 'sum', 'new': 'sum', 'first_seen': 'min', 'last_seen': 'max'}
+        )
+        summary['new'] = summary['new'].astype(int)
+        summary['seen'] = summary['total'] - summary['new']
+        summary['new_ratio'] = (summary['new'] / summary['total']).round(2)
+        # At least one day of history, so a single cycle doesn't divide by zero
+        days = ((summary['last_seen'] - summary['first_seen']).dt.total_seconds() / 86400).clip(lower=1)
+        summary['per_day'] = (summary['total'] / days).round(2)
+
+        return summary[['total', 'new', 'seen', 'new_ratio', 'first_seen', 'last_seen', 'per_day']] \
+            .sort_values('total', ascending=False)
+
+    def daily_counts(self, university: str = None) -> pd.DataFrame:
+        """Items scraped per day, one column per table"""
+        return self._period_counts('D', university)
+
+    def monthly_counts(self, university: str = None) -> pd.DataFrame:
+        """Items scraped per month, one column per table"""
+        return self._period_counts('M', university)
+
+    def _period_counts(self, freq: str, university: str = None) -> pd.DataFrame:
+        series = {}
+        for table_name in TABLES:
+            partials = [
+                chunk['scraped_at'].dt.to_period(freq).value_counts()
+                for chunk in self.iter_chunks(table_name, ['scraped_at'], university)
+            ]
+            if partials:
+                series[table_name] = pd.concat(partials).groupby(level=0).sum()
+
+        if not series:
+            return pd.DataFrame(columns=list(TABLES))
+
+        counts = pd.DataFrame(series).reindex(columns=list(TABLES)).fillna(0).astype(int).sort_index()
+        counts.index.name = 'period'
+        return counts
+
+    def deadlines_by_month(self, university: str = None) -> pd.DataFrame:
+        """Deadlines per closing month and university"""
+        partials = []
+        for chunk in self.iter_chunks('deadlines', ['university', 'deadline_date'], university):
+            closes = pd.to_datetime(chunk['deadline_date']).dt.to_period('M')
+            partials.append(chunk.assign(month=closes).dropna(subset=['month'])
+                            .groupby(['month', 'university']).size())
+
+        if not partials:
+            return pd.DataFrame()
+
+        counts = pd.concat(partials).groupby(level=[0, 1]).sum().unstack(fill_value=0).sort_index()
+        counts.index.name = 'closing month'
+        return counts
+
+    def summary(self, university: str = None) -> Dict[str, pd.DataFrame]:
+        """All report frames used by `--stats`"""
+        report = {name: self.university_summary(name, university) for name in TABLES}
+        report['daily'] = self.daily_counts(university)
+        report['monthly'] = self.monthly_counts(university)
+        report['deadline_months'] = self.deadlines_by_month(university)
+        return report
+
+    def export(self, directory: str, fmt: str = 'parquet', university: str = None) -> List[str]:
+        """Export each table to `directory` chunk by chunk, return written paths"""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for table_name in TABLES:
+            path = os.path.join(directory, f"{table_name}.{fmt}")
+            if fmt == 'parquet':
+                rows = self._export_parquet(table_name, path, university)
+            elif fmt == 'csv':
+                rows = self._export_csv(table_name, path, university)
+            else:
+                raise ValueError(f"Unsupported export format: {fmt}")
+            logger.info(f"Exported {rows} {table_name} rows to {path}")
+            paths.append(path)
+        return paths
+
+    def _export_parquet(self, table_name: str, path: str, university: str = None) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+        schema = self._arrow_schema(table_name, pa)
+        rows = 0
+        with pq.ParquetWriter(path, schema) as writer:
+            for chunk in self.iter_chunks(table_name, university=university):
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                rows += len(chunk)
+        return rows
+
+    def _arrow_schema(self, table_name: str, pa):
+        """Arrow schema from the table definition, so every chunk is written with the same types"""
+        fields = []
+        for column in TABLES[table_name].c:
+            python_type = column.type.python_type
+            if python_type is int:
+                arrow_type = pa.int64()
+            elif python_type is datetime:
+                arrow_type = pa.timestamp('us')
+            elif python_type is date:
+                arrow_type = pa.date32()
+            else:
+                arrow_type = pa.string()
+            fields.append(pa.field(column.name, arrow_type))
+        return pa.schema(fields)
+
+    def _export_csv(self, table_name: str, path: str, university: str = None) -> int:
+        rows = 0
+        header = True
+        with open(path, 'w', newline='') as f:
+            for chunk in self.iter_chunks(table_name, university=university):
+                chunk.to_csv(f, header=header, index=False)
+                header = False
+                rows += len(chunk)
+        if header:
+            self._empty_frame(table_name).to_csv(path, index=False)
+        return rows
+
+    def _empty_frame(self, table_name: str) -> pd.DataFrame:
+        return pd.DataFrame(columns=[c.name for c in TABLES[table_name].c])
@@ -0,0 +1,80 @@
+import pytest
+
+from src.agent import UniversityAgent
+from src.config import UniversityConfig
+from src.database import DatabaseManager
+
+
+class Crash(BaseException):
+    """Stands in for the process dying; not caught by the agent's per-university handler"""
+
+
+class FixtureScraper:
+    """One article per university; raises Crash when scraping `crash_on`"""
+
+    def __init__(self, crash_on=None):
+        self.crash_on = crash_on
+        self.scraped = []
+
+    def scrape_news(self, uni):
+        if uni.name == self.crash_on:
+            raise Crash()
+        self.scraped.append(uni.name)
+        return [{'university': uni.name, 'title': f"{uni.name} news", 'url': f"https://{uni.name}/n/1",
+                 'date': '', 'content': 'Body', 'scraped_at': '2026-10-19 08:00:00'}]
+
+    def scrape_applications(self, uni):
+        return []
+
+    def scrape_vacancies(self, uni):
+        return []
+
+
+class RecordingNotifier:
+    def __init__(self):
+        self.notified = []
+
+    def send_console_notification(self, articles, deadlines):
+        self.notified.extend(article['title'] for article in articles)
+
+    def format_news_email(self, articles):
+        return None
+
+
+def make_agent(db, scraper, notifier):
+    agent = UniversityAgent(scraper, db, notifier)
+    agent.load_universities([
+        UniversityConfig(name=name, base_url=f"https://{name}", news_url=f"https://{name}/news",
+                         applications_url=None, selectors={})
+        for name in ('A', 'B', 'C')
+    ])
+    return agent
+
+
+def test_crashed_cycle_resumes_and_notifies_each_item_once(tmp_path, monkeypatch):
+    monkeypatch.setattr('src.agent.time.sleep', lambda seconds: None)
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'university_data.db'}")
+    notifier = RecordingNotifier()
+
+    crashing = FixtureScraper(crash_on='B')
+    with pytest.raises(Crash):
+        make_agent(db, crashing, notifier).run_scraping_cycle()
+    assert crashing.scraped == ['A']
+    assert notifier.notified == []
+
+    resuming = FixtureScraper()
+    assert make_agent(db, resuming, notifier).run_scraping_cycle() == 3
+    assert resuming.scraped == ['B', 'C']
+    assert sorted(notifier.notified) == ['A news', 'B news', 'C news']
+
+    assert make_agent(db, FixtureScraper(), notifier).run_scraping_cycle() == 0
+    assert len(notifier.notified) == 3
+
+
+def test_cycle_owned_by_live_process_is_not_resumed(tmp_path):
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'university_data.db'}")
+    cycle_id, _ = db.start_cycle(owner='daemon-host:1')
+
+    assert db.start_cycle(owner='cli-host:2') == (None, False)
+    assert db.start_cycle(resume=False, owner='cli-host:2') == (None, False)
+    assert db.heartbeat(cycle_id, 'daemon-host:1')
@@ -0,0 +1,95 @@
+import sqlite3
+from datetime import date, datetime, timedelta
+
+from src.config import Config
+from src.database import DatabaseManager
+from src.retention import RetentionManager
+
+# news_articles as created before AUTOINCREMENT was added
+BASELINE_NEWS_SCHEMA = """
+CREATE TABLE news_articles (
+    id INTEGER NOT NULL, article_hash VARCHAR(64), university VARCHAR(100), title VARCHAR(500),
+    url VARCHAR(1000), date VARCHAR(100), content TEXT, scraped_at DATETIME, is_new INTEGER,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_news_articles_article_hash ON news_articles (article_hash);
+"""
+
+
+def make_db(tmp_path, name='university_data.db'):
+    return DatabaseManager(f"sqlite:///{tmp_path / name}")
+
+
+def article(title, scraped_at='2026-10-19 08:00:00'):
+    return {'university': 'Fixture U', 'title': title, 'url': f"https://uni.example/{title}",
+            'date': '', 'content': 'Body', 'scraped_at': scraped_at}
+
+
+def make_retention(db, tmp_path):
+    class RetentionConfig(Config):
+        ARCHIVE_DATABASE_URL = f"sqlite:///{tmp_path / 'archive.db'}"
+        RETENTION_POLICIES = {'news': {'max_age_days': 30}}
+    return RetentionManager(db, RetentionConfig)
+
+
+def test_rescraped_yearless_deadline_moves_to_this_year(tmp_path):
+    db = make_db(tmp_path)
+    row = {'university': 'Fixture U', 'info': 'Closing date 30 Sept'}
+
+    assert len(db.save_deadlines([dict(row, scraped_at='2025-08-01 09:00:00')])) == 1
+    assert db.save_deadlines([dict(row, scraped_at='2026-08-01 09:00:00')]) == []
+
+    upcoming = db.get_upcoming_deadlines(days=90, start=date(2026, 8, 2))
+    assert [d.deadline_date for d in upcoming] == [date(2026, 9, 30)]
+
+
+def test_baseline_table_is_rebuilt_with_autoincrement(tmp_path):
+    path = tmp_path / 'university_data.db'
+    with sqlite3.connect(path) as conn:
+        conn.executescript(BASELINE_NEWS_SCHEMA)
+        conn.executemany("INSERT INTO news_articles (id, article_hash, title) VALUES (?, ?, ?)",
+                         [(1, 'h1', 'one'), (2, 'h2', 'two'), (5, 'h5', 'five')])
+
+    db = DatabaseManager(f"sqlite:///{path}")
+
+    with db.engine.connect() as conn:
+        create_sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'news_articles'"
+        ).scalar()
+        assert 'AUTOINCREMENT' in create_sql
+        assert conn.exec_driver_sql("SELECT id, title FROM news_articles ORDER BY id").all() == \
+            [(1, 'one'), (2, 'two'), (5, 'five')]
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM news_articles WHERE id = 5")
+    db.save_news_articles([article('six')])
+    with db.engine.connect() as conn:
+        # The deleted id 5 is not handed out again
+        assert conn.exec_driver_sql("SELECT id FROM news_articles WHERE title = 'six'").scalar() == 6
+
+
+def test_archived_item_is_not_saved_as_new_again(tmp_path):
+    db = make_db(tmp_path)
+    old = (datetime.now() - timedelta(days=60)).strftime('%Y-%m-%d %H:%M:%S')
+    db.save_news_articles([article('old', scraped_at=old), article('fresh')])
+
+    retention = make_retention(db, tmp_path)
+    assert retention.run_maintenance()['archived'] == 1
+
+    assert [a.title for a in db.get_recent_news()] == ['fresh']
+    assert db.save_news_articles([article('old')]) == []
+    with retention._archive_engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT title FROM news_articles").scalars().all() == ['old']
+
+
+def test_cold_bodies_are_compressed_and_read_back(tmp_path):
+    db = make_db(tmp_path)
+    body = 'Applications for 2027 are open. ' * 20
+    old = (datetime.now() - timedelta(days=60)).strftime('%Y-%m-%d %H:%M:%S')
+    db.save_news_articles([dict(article('cold', scraped_at=old), content=body)])
+
+    retention = make_retention(db, tmp_path)
+    assert retention.compress_cold('news', {'compress_after_days': 30}) == 1
+
+    with db.engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT typeof(content) FROM news_articles").scalar() == 'blob'
+    assert db.get_recent_news()[0].content == body
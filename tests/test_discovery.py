@@ -0,0 +1,110 @@
+import json
+
+import requests
+from requests.adapters import BaseAdapter
+
+from src.config import Config
+from src.discovery import UniversityDiscovery
+
+NEWS_PAGE = """<html><body>
+<div class="news-item"><h3><a href="/n/1">First</a></h3><time>1 May 2026</time><p>One</p></div>
+<div class="news-item"><h3><a href="/n/2">Second</a></h3><time>2 May 2026</time><p>Two</p></div>
+</body></html>"""
+
+APPLY_PAGE = "<html><body><ul><li>Closing date 30 Sept</li><li>Apply by 1 Oct</li></ul></body></html>"
+
+
+class FixtureAdapter(BaseAdapter):
+    """Serve fixture pages by URL; everything else is a 404"""
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+        self.requested = []
+
+    def send(self, request, **kwargs):
+        self.requested.append(request.url)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        body = self.pages.get(request.url.rstrip('/'))
+        response.status_code = 200 if body is not None else 404
+        response.headers['Content-Type'] = 'text/html'
+        response._content = (body or '').encode('utf-8')
+        return response
+
+    def close(self):
+        pass
+
+
+def make_discovery(pages):
+    session = requests.Session()
+    adapter = FixtureAdapter(pages)
+    session.mount('https://', adapter)
+    return UniversityDiscovery(Config, session=session, cache_path=''), adapter
+
+
+def test_discover_verifies_sections_and_scores_selectors():
+    discovery, _ = make_discovery({
+        'https://uni.example/news': NEWS_PAGE,
+        'https://uni.example/admissions': APPLY_PAGE,
+    })
+
+    discovered = discovery.discover([
+        {'name': 'Fixture U', 'base_url': 'https://uni.example'},
+        {'name': 'Dead U', 'base_url': 'https://dead.example'},
+    ])
+
+    assert [uni['name'] for uni in discovered] == ['Fixture U']
+    uni = discovered[0]
+    assert uni['news_url'] == 'https://uni.example/news'
+    assert uni['applications_url'] == 'https://uni.example/admissions'
+    assert uni['vacancies_url'] is None
+    assert uni['selectors']['news_articles'] == '.news-item'
+    assert uni['selectors']['news_title'] == 'h3 a'
+    assert uni['selectors']['news_date'] == 'time'
+    assert uni['selectors']['application_deadlines'] == 'li'
+
+
+def test_probes_are_interleaved_across_hosts():
+    discovery, adapter = make_discovery({})
+    discovery.max_workers = 1
+
+    discovery.discover([
+        {'name': 'A', 'base_url': 'https://a.example'},
+        {'name': 'B', 'base_url': 'https://b.example'},
+    ])
+
+    hosts = [url.split('/')[2] for url in adapter.requested]
+    assert hosts[:4] == ['a.example', 'b.example', 'a.example', 'b.example']
+
+
+def test_merge_keeps_hand_tuned_selector_groups(tmp_path):
+    path = tmp_path / 'universities.json'
+    path.write_text(json.dumps({'universities': [{
+        'name': 'Fixture U',
+        'base_url': 'https://uni.example',
+        'news_url': 'https://uni.example/latest',
+        'applications_url': 'https://uni.example/apply',
+        'selectors': {'news_articles': '.mine'},
+    }]}))
+    discovery, _ = make_discovery({})
+
+    added, updated = discovery.merge_into_file([
+        {
+            'name': 'Fixture U',
+            'base_url': 'https://uni.example',
+            'news_url': 'https://uni.example/news',
+            'applications_url': None,
+            'vacancies_url': 'https://uni.example/vacancies',
+            'selectors': {'news_articles': 'article', 'news_title': 'h2', 'vacancies': '.job', 'vacancy_title': 'a'},
+        },
+        {'name': 'New U', 'base_url': 'https://new.example', 'news_url': None,
+         'applications_url': None, 'vacancies_url': None, 'selectors': {}},
+    ], str(path))
+
+    assert (added, updated) == (1, 1)
+    uni = json.loads(path.read_text())['universities'][0]
+    assert uni['news_url'] == 'https://uni.example/latest'
+    assert uni['vacancies_url'] == 'https://uni.example/vacancies'
+    assert uni['selectors'] == {'news_articles': '.mine', 'vacancies': '.job', 'vacancy_title': 'a'}
@@ -0,0 +1,73 @@
+from datetime import date
+
+from src.parser import extract_deadline, find_dates
+
+SCRAPED = date(2026, 10, 19)
+
+
+def test_may_as_verb_is_not_a_date():
+    result = extract_deadline("Grade 12 may apply. Closing date 30/11/2026", reference=SCRAPED)
+
+    assert result['deadline_date'] == date(2026, 11, 30)
+    assert [d['date'] for d in find_dates("Learners may apply online", SCRAPED)] == []
+    assert [d['date'] for d in find_dates("Closes 12 May 2026", SCRAPED)] == [date(2026, 5, 12)]
+
+
+def test_opening_date_is_not_the_programme():
+    result = extract_deadline("Opens 1 May 2026, closes 30 September 2026", reference=SCRAPED)
+
+    assert result == {'deadline_date': date(2026, 9, 30), 'programme': None}
+
+
+def test_programme_before_opening_date_is_kept():
+    result = extract_deadline("MBA applications open 1 May 2026, closing date 30 Sept 2026", reference=SCRAPED)
+
+    assert result == {'deadline_date': date(2026, 9, 30), 'programme': 'MBA applications'}
+
+
+def test_weekday_is_not_the_programme():
+    result = extract_deadline("Closing date: Friday, 7 November 2026", reference=SCRAPED)
+
+    assert result == {'deadline_date': date(2026, 11, 7), 'programme': None}
+
+
+def test_yearless_date_that_just_passed_stays_in_the_past():
+    result = extract_deadline("BSc Engineering - closing date 30 Sept", reference=SCRAPED)
+
+    assert result == {'deadline_date': date(2026, 9, 30), 'programme': 'BSc Engineering'}
+
+
+def test_yearless_date_early_next_year_rolls_forward():
+    assert extract_deadline("Apply by 15 Jan", reference=SCRAPED)['deadline_date'] == date(2027, 1, 15)
+
+
+def test_programme_between_keyword_and_date():
+    result = extract_deadline("Closing date for Engineering is 31 May 2027", reference=SCRAPED)
+
+    assert result == {'deadline_date': date(2027, 5, 31), 'programme': 'Engineering'}
+
+
+def test_programme_from_table_cells():
+    result = extract_deadline("Postgraduate Diploma | Closing date | 2026-11-30",
+                              cells=["Postgraduate Diploma", "Closing date", "2026-11-30"], reference=SCRAPED)
+
+    assert result == {'deadline_date': date(2026, 11, 30), 'programme': 'Postgraduate Diploma'}
+
+
+def test_year_first_slash_date():
+    result = extract_deadline("Postgraduate: applications closed on 2026/09/30", reference=SCRAPED)
+
+    assert result['deadline_date'] == date(2026, 9, 30)
+    assert [d['date'] for d in find_dates("Due date: 2026.11.30", SCRAPED)] == [date(2026, 11, 30)]
+
+
+def test_due_to_is_not_a_deadline_keyword():
+    result = extract_deadline("Due to high demand, closing date extended to 15 November 2026", reference=SCRAPED)
+
+    assert result == {'deadline_date': date(2026, 11, 15), 'programme': None}
+
+
+def test_open_day_is_not_the_programme():
+    result = extract_deadline("Open Day: 3 May 2026. Closing date: 30 September 2026", reference=SCRAPED)
+
+    assert result == {'deadline_date': date(2026, 9, 30), 'programme': None}
@@ -0,0 +1,14 @@
+from datetime import date
+
+import pandas as pd
+
+from src.stats import last_days
+
+
+def test_last_days_covers_calendar_days_not_days_with_data():
+    daily = pd.DataFrame({'news': [35, 2]}, index=pd.PeriodIndex(['2026-01-09', '2026-10-18'], freq='D'))
+
+    recent = last_days(daily, 3, today=date(2026, 10, 19))
+
+    assert [str(p) for p in recent.index] == ['2026-10-17', '2026-10-18', '2026-10-19']
+    assert recent['news'].tolist() == [0, 2, 0]